@@ -38,7 +38,7 @@ from analytics.holders_analysis import (
     calculate_smart_score as calc_smart_score,
     HoldersAnalysisResult
 )
-from polymarket_api import PolymarketApiClient
+from polymarket_api import api_client
 
 
 # =====================================================================
@@ -150,16 +150,13 @@ async def run_deep_analysis(
         tasks["trades"] = _fetch_trades(market)
         
         # Holders (New)
-        async def _fetch_holders_task():
-            async with PolymarketApiClient() as client:
-                return await client.get_market_holders(
-                    market.condition_id,
-                    yes_price=market.yes_price,
-                    no_price=market.no_price,
-                    limit=100,  # "Rocket Mode": Top 100 is enough for Smart Money analysis
-                )
-        
-        tasks["holders"] = _fetch_holders_task()
+        # Shared client: reuses the pooled session and the global rate limiter
+        tasks["holders"] = api_client.get_market_holders(
+            market.condition_id,
+            yes_price=market.yes_price,
+            no_price=market.no_price,
+            limit=100,  # "Rocket Mode": Top 100 is enough for Smart Money analysis
+        )
 
         # Run all fetches in parallel
         if tasks:
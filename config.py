@@ -33,6 +33,31 @@ class Settings(BaseSettings):
              return v.replace("postgresql://", "postgresql+asyncpg://", 1)
         return v
 
+    # Connection pool — sized for bursts of short single-query sessions
+    db_pool_size: int = Field(
+        default=20,
+        ge=1,
+        description="Persistent connections kept in the DB pool",
+    )
+
+    db_max_overflow: int = Field(
+        default=40,
+        ge=0,
+        description="Extra connections allowed above db_pool_size under load",
+    )
+
+    db_pool_timeout_seconds: int = Field(
+        default=30,
+        ge=1,
+        description="Seconds to wait for a free pooled connection",
+    )
+
+    db_pool_recycle_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description="Recycle pooled connections older than this",
+    )
+
     # Polymarket API URLs
     polymarket_data_api_url: str = Field(
         default="https://data-api.polymarket.com",
@@ -108,6 +133,20 @@ def get_settings() -> Settings:
     return Settings()
 
 
+@lru_cache
+def get_referral_suffix() -> str:
+    """"?via=<code>" for the configured referral code, or "" if unset.
+
+    Computed once — settings are immutable for the life of the process.
+    Call get_referral_suffix.cache_clear() if the code is changed at runtime.
+    """
+    code = get_settings().polymarket_referral_code
+    if not code:
+        return ""
+    # Clean the referral code (remove any trailing dashes or spaces)
+    return f"?via={code.strip().rstrip('-')}"
+
+
 def get_referral_link(event_slug: str, market_slug: str = "") -> str:
     """
     Generate Polymarket link with referral code.
@@ -124,29 +163,11 @@ def get_referral_link(event_slug: str, market_slug: str = "") -> str:
         The market_slug parameter is NOT used in the URL as Polymarket
         doesn't support the /event/{event_slug}/{market_slug} format.
     """
-    settings = get_settings()
-    
     # Polymarket only supports /event/{event_slug} format
     # market_slug is NOT part of the valid URL structure
-    base_url = f"https://polymarket.com/event/{event_slug}"
-    
-    # Add referral code if configured
-    if settings.polymarket_referral_code:
-        # Clean the referral code (remove any trailing dashes or spaces)
-        ref_code = settings.polymarket_referral_code.strip().rstrip('-')
-        return f"{base_url}?via={ref_code}"
-    
-    return base_url
+    return f"https://polymarket.com/event/{event_slug}{get_referral_suffix()}"
 
 
 def get_profile_link(address: str) -> str:
     """Generate Polymarket profile link with referral code."""
-    settings = get_settings()
-    base_url = f"https://polymarket.com/profile/{address}"
-
-    if settings.polymarket_referral_code:
-        ref_code = settings.polymarket_referral_code.strip().rstrip('-')
-        return f"{base_url}?via={ref_code}"
-    
-    return base_url
-
+    return f"https://polymarket.com/profile/{address}{get_referral_suffix()}"
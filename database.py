@@ -28,13 +28,25 @@ class Database:
         """Initialize database engine and session factory."""
         settings = get_settings()
         
+        # asyncpg-only tuning: skip the JIT for short OLTP queries and cap
+        # how long a single statement may hang a handler
+        connect_args = {}
+        if "+asyncpg" in settings.database_url:
+            connect_args = {
+                "server_settings": {"jit": "off", "application_name": "betspy"},
+                "command_timeout": 60,
+            }
+
         # Create async engine
         self._engine = create_async_engine(
             settings.database_url,
             echo=settings.log_level == "DEBUG",
             pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            connect_args=connect_args,
         )
         
         # Create session factory
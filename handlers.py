@@ -7,18 +7,19 @@ from datetime import datetime
 from typing import Optional
 
 from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery, InlineKeyboardButton
+from aiogram.types import Message, CallbackQuery
 from aiogram.filters import Command, CommandStart
 from aiogram.enums import ParseMode
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from loguru import logger
+from sqlalchemy import select
 
 from database import db
+from models import TrackedWallet
 from repository import UserRepository, WalletRepository
 from polymarket_api import api_client
 from i18n import get_text, get_side_text, get_pnl_emoji, SUPPORTED_LANGUAGES
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from keyboards import (
     get_language_keyboard,
     get_main_menu_keyboard,
@@ -36,11 +37,12 @@ from keyboards import (
     get_wallet_settings_keyboard,
     get_min_amount_keyboard,
     get_markets_selection_keyboard,
+    get_back_to_results_keyboard,
 )
 from config import get_settings
 from market_intelligence import market_intelligence
 from services.format_service import format_market_detail, format_volume, format_market_card, format_unified_analysis
-from services.user_service import resolve_user
+from services.user_service import resolve_user, invalidate_user, update_language
 from analytics.orchestrator import run_deep_analysis
 
 # Create router
@@ -168,6 +170,7 @@ async def callback_language_onboarding(callback: CallbackQuery) -> None:
         )
         user.language = lang_code
         await session.commit()
+        invalidate_user(callback.from_user.id)
         
         settings = get_settings()
         # Send persistent reply keyboard
@@ -325,11 +328,10 @@ async def process_analyze_link(message: Message, state: FSMContext) -> None:
             # Multi-outcome event: show TOP-5
             top_markets = markets[:5]
             
-            text = get_text("multi_market_header", lang, count=len(markets)) + "\n\n"
-            
-            for i, market in enumerate(top_markets, 1):
-                # Use unified card format
-                text += format_market_card(market, i, lang) + "\n"
+            header = get_text("multi_market_header", lang, count=len(markets)) + "\n\n"
+            # Use unified card format
+            cards = [format_market_card(market, i, lang) for i, market in enumerate(top_markets, 1)]
+            text = header + "\n".join(cards) + "\n"
             
             # Save state for interactive selection
             await state.update_data(found_markets=markets)
@@ -420,13 +422,9 @@ async def callback_select_market(callback: CallbackQuery, state: FSMContext) ->
             
         text = format_unified_analysis(market, deep_result, lang)
         
-        # Back button
-        builder = InlineKeyboardBuilder()
-        builder.row(InlineKeyboardButton(text=get_text("btn.back", lang), callback_data="back_to_results"))
-        
         await callback.message.edit_text(
             text,
-            reply_markup=builder.as_markup(),
+            reply_markup=get_back_to_results_keyboard(lang),
             parse_mode=ParseMode.HTML,
             disable_web_page_preview=True,
         )
@@ -456,9 +454,9 @@ async def callback_back_to_results(callback: CallbackQuery, state: FSMContext) -
             
         # Re-render list
         top_markets = markets[:5]
-        text = get_text("multi_market_header", lang, count=len(markets)) + "\n\n"
-        for i, market in enumerate(top_markets, 1):
-            text += format_market_card(market, i, lang) + "\n"
+        header = get_text("multi_market_header", lang, count=len(markets)) + "\n\n"
+        cards = [format_market_card(market, i, lang) for i, market in enumerate(top_markets, 1)]
+        text = header + "\n".join(cards) + "\n"
             
         keyboard = get_markets_selection_keyboard(lang, len(top_markets))
         
@@ -735,8 +733,6 @@ async def callback_wallet_view(callback: CallbackQuery) -> None:
         )
         
         # Get wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -788,8 +784,6 @@ async def callback_wallet_positions(callback: CallbackQuery) -> None:
         )
         
         # Get wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -913,8 +907,6 @@ async def callback_wallet_stats_range_select(callback: CallbackQuery) -> None:
         )
         
         # Get wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -954,8 +946,6 @@ async def callback_wallet_stats_range(callback: CallbackQuery) -> None:
         )
         
         # Get wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -1041,8 +1031,6 @@ async def callback_wallet_debug(callback: CallbackQuery) -> None:
         )
         
         # Get wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -1118,8 +1106,6 @@ async def callback_wallet_trades(callback: CallbackQuery) -> None:
         )
         
         # Get wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -1192,8 +1178,6 @@ async def callback_wallet_remove(callback: CallbackQuery) -> None:
         )
         
         # Get wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -1231,8 +1215,6 @@ async def callback_wallet_confirm_remove(callback: CallbackQuery) -> None:
         )
         
         # Get and delete wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -1274,8 +1256,6 @@ async def callback_wallet_settings(callback: CallbackQuery) -> None:
         )
         
         # Get wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -1328,8 +1308,6 @@ async def callback_wallet_pause(callback: CallbackQuery) -> None:
         )
         
         # Get and update wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -1369,8 +1347,6 @@ async def callback_wallet_resume(callback: CallbackQuery) -> None:
         )
         
         # Get and update wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -1435,8 +1411,6 @@ async def callback_set_min_amount(callback: CallbackQuery) -> None:
         )
         
         # Get and update wallet
-        from sqlalchemy import select
-        from models import TrackedWallet
         
         stmt = select(TrackedWallet).where(
             TrackedWallet.id == wallet_id,
@@ -1518,20 +1492,19 @@ async def callback_set_language(callback: CallbackQuery) -> None:
         await callback.answer("Invalid language")
         return
     
-    async with db.session() as session:
-        user_repo = UserRepository(session)
-        await user_repo.update_language(callback.from_user.id, lang_code)
-        
-        await callback.message.edit_text(
-            get_text("language_changed", lang_code),
-            reply_markup=get_settings_keyboard(lang_code),
-            parse_mode=ParseMode.HTML,
-        )
-        # Update persistent reply keyboard to new language
-        await callback.message.answer(
-            "✅",
-            reply_markup=get_persistent_menu(lang_code),
-        )
+    # Commits, then drops the cached user — no stale-language window
+    await update_language(callback.from_user.id, lang_code)
+
+    await callback.message.edit_text(
+        get_text("language_changed", lang_code),
+        reply_markup=get_settings_keyboard(lang_code),
+        parse_mode=ParseMode.HTML,
+    )
+    # Update persistent reply keyboard to new language
+    await callback.message.answer(
+        "✅",
+        reply_markup=get_persistent_menu(lang_code),
+    )
     
     await callback.answer()
 
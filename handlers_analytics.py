@@ -15,7 +15,8 @@ from services.user_service import resolve_user
 from services.format_service import format_unified_analysis
 from analytics.orchestrator import run_deep_analysis
 from analytics.kelly import DEFAULT_BANKROLL
-from keyboards_intelligence import get_cached_market, get_category_keyboard
+from polymarket_api import api_client
+from keyboards_intelligence import get_cached_market, get_category_keyboard, get_deep_analysis_keyboard
 
 
 router = Router(name="analytics")
@@ -28,7 +29,7 @@ async def callback_deep_analysis(callback: CallbackQuery) -> None:
     
     Callback data: deep:{cache_key}
     """
-    cache_key = callback.data.split(":")[1]
+    _, _, cache_key = callback.data.partition(":")
     user, lang = await resolve_user(callback.from_user)
 
     try:
@@ -64,9 +65,7 @@ async def callback_deep_analysis(callback: CallbackQuery) -> None:
 
         # --- TEMPORARY TEST AS REQUESTED ---
         try:
-            from polymarket_api import PolymarketApiClient
-            async with PolymarketApiClient() as api:
-                await api.test_holders_endpoint(market.condition_id)
+            await api_client.test_holders_endpoint(market.condition_id)
         except Exception as e:
             logger.error(f"Test endpoint failed: {e}")
         # -----------------------------------
@@ -78,31 +77,9 @@ async def callback_deep_analysis(callback: CallbackQuery) -> None:
 
         text = format_unified_analysis(market, result, lang)
 
-        # Build keyboard with back button
-        from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-        from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-        builder = InlineKeyboardBuilder()
-        builder.row(
-            InlineKeyboardButton(
-                text=get_text("intel.link_text", lang),
-                url=market.market_url,
-            )
-        )
-        builder.row(
-            InlineKeyboardButton(
-                text=get_text("btn.back", lang),
-                callback_data="intel:back_categories",
-            ),
-            InlineKeyboardButton(
-                text=get_text("btn.back_to_menu", lang),
-                callback_data="menu:main",
-            ),
-        )
-
         await callback.message.edit_text(
             text,
-            reply_markup=builder.as_markup(),
+            reply_markup=get_deep_analysis_keyboard(lang, market),
             parse_mode=ParseMode.HTML,
             disable_web_page_preview=True,
         )
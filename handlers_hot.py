@@ -2,67 +2,117 @@
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from aiogram.enums import ParseMode
-from aiogram.utils.keyboard import InlineKeyboardBuilder
-from aiogram.types import InlineKeyboardButton
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from loguru import logger
-import html
+from typing import Dict, Tuple
+import time
 
 from database import db
 from services.user_service import resolve_user
-from services.format_service import format_market_card, format_volume, format_price
+from services.telegram_service import safe_edit
+from services.format_service import format_market_card, format_volume, format_price, escape_html
 from i18n import get_text
 from market_intelligence import market_intelligence, Category, TimeFrame
-from keyboards_intelligence import get_trending_keyboard, get_category_keyboard
 
 router = Router(name="hot_today")
 
+ITEMS_PER_PAGE = 10
+HOT_MARKETS_LIMIT = 100
+# Upper bound on pages; callback page numbers are clamped to it before any
+# cache lookup, so forged "intel:hot:<n>" can't grow _PAGE_CACHE
+_MAX_PAGES = -(-HOT_MARKETS_LIMIT // ITEMS_PER_PAGE)
 
-async def get_hot_page_content(page: int, lang: str):
+# Rendered pages per (page, lang) → (text, reply_markup, rendered_at).
+# Repeat clicks on a page skip fetch + formatting entirely.
+_PAGE_CACHE: Dict[Tuple[int, str], Tuple[str, InlineKeyboardMarkup, float]] = {}
+_PAGE_CACHE_TTL = 60  # seconds
+# Bumped by every forced refresh once its fetch lands; a render that started
+# on older data sees a different generation and doesn't store its page
+_page_generation = 0
+
+# Every label the page render needs, resolved in one pass before rendering
+_HOT_LABEL_KEYS = ("hot.title", "btn.refresh", "btn.back")
+
+# Refresh is the only path that refetches; page flips are served from cache
+HOT_REFRESH_CALLBACK = "intel:hot:refresh"
+
+
+def _get_cached_page(page: int, lang: str):
+    """Return a fresh cached (text, reply_markup) for the page, or None."""
+    entry = _PAGE_CACHE.get((page, lang))
+    if entry and time.time() - entry[2] < _PAGE_CACHE_TTL:
+        return entry[0], entry[1]
+    return None
+
+
+async def get_hot_page_content(page: int, lang: str, force: bool = False):
     """
     Fetch and format hot markets page.
     Returns (text, reply_markup) or (None, None) if empty/error.
+
+    Rendered pages are cached for _PAGE_CACHE_TTL; pass force=True to
+    bypass the cache and re-render.
     """
+    global _page_generation
+    page = max(1, min(page, _MAX_PAGES))
+    if not force:
+        cached = _get_cached_page(page, lang)
+        if cached:
+            return cached
+    generation = _page_generation
+
     try:
-        # Fetch markets (limit 100)
+        # Fetch markets — cached in the engine, so page flips are pure slicing
         markets = await market_intelligence.fetch_trending_markets(
             category=Category.ALL,
-            timeframe=TimeFrame.MONTH, # Ignored by simplified logic
-            limit=100,
+            timeframe=TimeFrame.MONTH,  # Ignored by simplified logic
+            limit=HOT_MARKETS_LIMIT,
+            force_refresh=force,
         )
+        if force:
+            # Fresh data invalidates every rendered page, not just this one.
+            # Cleared only now: a render racing the fetch could otherwise
+            # re-cache a page built from the old data.
+            _page_generation += 1
+            generation = _page_generation
+            _PAGE_CACHE.clear()
 
         if not markets:
             return None, None
 
         # Pagination Logic
-        items_per_page = 10
         total_items = len(markets)
-        total_pages = (total_items + items_per_page - 1) // items_per_page
+        total_pages = -(-total_items // ITEMS_PER_PAGE)
         
+        # Resolve labels up front so the render below is one synchronous pass
+        labels = {key: get_text(key, lang) for key in _HOT_LABEL_KEYS}
+
         # Clamp page
         page = max(1, min(page, total_pages))
         
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
+        start_idx = (page - 1) * ITEMS_PER_PAGE
+        end_idx = start_idx + ITEMS_PER_PAGE
         page_markets = markets[start_idx:end_idx]
 
         # Build Text List
-        text = f"🔥 <b>{get_text('hot.title', lang)}</b> (Page {page}/{total_pages})\n\n"
+        parts = [f"🔥 <b>{labels['hot.title']}</b> (Page {page}/{total_pages})\n\n"]
+        _a = parts.append
         
-        for i, m in enumerate(page_markets):
-            idx = start_idx + i + 1
+        for idx, m in enumerate(page_markets, start_idx + 1):
             # Clean title
-            q = html.escape(m.question)
+            q = escape_html(m.question)
             
             vol = format_volume(m.volume_24h)
             y_p = format_price(m.yes_price)
             n_p = format_price(m.no_price)
             
-            text += f"<b>{idx}. {q}</b>\n"
-            text += f"📊 Vol: {vol} · 💰 {y_p} / {n_p}\n"
-            text += f"🔗 <a href='{m.market_url}'>Open Market</a>\n\n"
+            _a(f"<b>{idx}. {q}</b>\n"
+               f"📊 Vol: {vol} · 💰 {y_p} / {n_p}\n"
+               f"🔗 <a href='{m.market_url}'>Open Market</a>\n\n")
+
+        text = "".join(parts)
 
         # Build Pagination Keyboard
-        builder = InlineKeyboardBuilder()
         nav_row = []
         
         if page > 1:
@@ -72,46 +122,54 @@ async def get_hot_page_content(page: int, lang: str):
         
         if page < total_pages:
             nav_row.append(InlineKeyboardButton(text="➡️", callback_data=f"intel:hot:{page+1}"))
-            
-        builder.row(*nav_row)
-        
-        # Back button
-        builder.row(InlineKeyboardButton(text=get_text("btn.back", lang), callback_data="menu:main"))
-        
-        return text, builder.as_markup()
+
+        reply_markup = InlineKeyboardMarkup(inline_keyboard=[
+            nav_row,
+            [InlineKeyboardButton(text=labels["btn.refresh"], callback_data=HOT_REFRESH_CALLBACK)],
+            # Back button
+            [InlineKeyboardButton(text=labels["btn.back"], callback_data="menu:main")],
+        ])
+        # Keyed on the clamped page: at most _MAX_PAGES entries per language
+        if generation == _page_generation:
+            _PAGE_CACHE[(page, lang)] = (text, reply_markup, time.time())
+        return text, reply_markup
 
     except Exception as e:
         logger.error(f"Error generating hot page: {e}", exc_info=True)
         return None, None
 
 
+def _parse_hot_page(data: str) -> int:
+    """Parse page from callback data "intel:hot:PAGE" (defaults to 1)."""
+    parts = data.split(":", 2)
+    if len(parts) == 3:
+        try:
+            return int(parts[2])
+        except ValueError:
+            pass
+    return 1
+
+
 @router.callback_query(F.data.startswith("intel:hot"))
 async def callback_hot_today(callback: CallbackQuery) -> None:
     """Show Hot Today — paginated list of top markets by volume."""
     user, lang = await resolve_user(callback.from_user)
 
-    # Parse page from callback data: "intel:hot:PAGE"
-    page = 1
-    parts = callback.data.split(":")
-    if len(parts) >= 3:
+    force = callback.data == HOT_REFRESH_CALLBACK
+    page = 1 if force else _parse_hot_page(callback.data)
+
+    if page == 1:
+        # Only answer/loading on first load to avoid flicker on pagination
         try:
-            page = int(parts[2])
-        except ValueError:
-            page = 1
-            
-    try:
-        if page == 1:
-            # Only answer/loading on first load to avoid flicker on pagination
             await callback.answer()
-            await callback.message.edit_text(
-                get_text("loading", lang),
-                parse_mode=ParseMode.HTML,
-            )
-    except Exception:
-        pass
+        except Exception:
+            pass
+        # The placeholder only masks fetch latency — skip it on a cache hit
+        if force or _get_cached_page(page, lang) is None:
+            await safe_edit(callback.message, get_text("loading", lang), parse_mode=ParseMode.HTML)
 
     try:
-        text, reply_markup = await get_hot_page_content(page, lang)
+        text, reply_markup = await get_hot_page_content(page, lang, force=force)
 
         if not text:
             await callback.message.edit_text(
@@ -121,7 +179,8 @@ async def callback_hot_today(callback: CallbackQuery) -> None:
             )
             return
 
-        await callback.message.edit_text(
+        await safe_edit(
+            callback.message,
             text,
             reply_markup=reply_markup,
             parse_mode=ParseMode.HTML,
@@ -130,13 +189,7 @@ async def callback_hot_today(callback: CallbackQuery) -> None:
 
     except Exception as e:
         logger.error(f"Hot today error: {e}", exc_info=True)
-        try:
-            await callback.message.edit_text(
-                get_text("error_generic", lang),
-                parse_mode=ParseMode.HTML,
-            )
-        except Exception:
-            pass
+        await safe_edit(callback.message, get_text("error_generic", lang), parse_mode=ParseMode.HTML)
 
 
 def setup_hot_handlers(dp) -> None:
@@ -12,16 +12,16 @@ from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from aiogram.enums import ParseMode
 from loguru import logger
-import math
-import html
 
 from i18n import get_text
 from services.user_service import resolve_user
+from services.telegram_service import safe_edit
 from services.format_service import (
     format_market_card,
     format_market_detail,
     format_market_links_footer,
     format_unified_analysis,
+    escape_html,
 )
 from analytics.orchestrator import run_deep_analysis, DeepAnalysis
 from market_intelligence import (
@@ -31,7 +31,7 @@ from market_intelligence import (
     MarketStats,
 )
 from keyboards_intelligence import (
-    get_trending_keyboard,
+    get_category_keyboard,
     get_market_detail_keyboard,
     get_cached_market,
 )
@@ -48,7 +48,7 @@ router = Router(name="intelligence")
 @router.callback_query(F.data.startswith("intel:m:"))
 async def callback_market_detail(callback: CallbackQuery) -> None:
     """Show detailed market analysis."""
-    cache_key = callback.data.split(":")[2]
+    _, _, cache_key = callback.data.split(":", 2)
 
     user, lang = await resolve_user(callback.from_user)
 
@@ -59,22 +59,17 @@ async def callback_market_detail(callback: CallbackQuery) -> None:
 
     market = get_cached_market(cache_key)
     if not market:
-        try:
-            await callback.message.edit_text(
-                get_text("intel.market_not_found", lang),
-                reply_markup=get_category_keyboard(lang),
-                parse_mode=ParseMode.HTML,
-            )
-        except Exception:
-            pass
+        await safe_edit(
+            callback.message,
+            get_text("intel.market_not_found", lang),
+            reply_markup=get_category_keyboard(lang),
+            parse_mode=ParseMode.HTML,
+        )
         return
 
     try:
         # Show Loading
-        try:
-            await callback.message.edit_text("⏳ Analyzing market deeply...", parse_mode=ParseMode.HTML)
-        except Exception:
-            pass
+        await safe_edit(callback.message, "⏳ Analyzing market deeply...", parse_mode=ParseMode.HTML)
 
         # Run Deep Analysis
         error_info = None
@@ -95,7 +90,7 @@ async def callback_market_detail(callback: CallbackQuery) -> None:
         text = format_unified_analysis(market, deep_result, lang)
         
         if error_info:
-            text += f"\n\n🛑 <b>DEBUG ERROR:</b> {html.escape(error_info)}"
+            text += f"\n\n🛑 <b>DEBUG ERROR:</b> {escape_html(error_info)}"
 
         await callback.message.edit_text(
             text,
@@ -105,13 +100,11 @@ async def callback_market_detail(callback: CallbackQuery) -> None:
         )
     except Exception as e:
         logger.error(f"Market detail error: {e}", exc_info=True)
-        try:
-            await callback.message.edit_text(
-                get_text("intel.error_loading", lang),
-                parse_mode=ParseMode.HTML,
-            )
-        except Exception:
-            pass
+        await safe_edit(
+            callback.message,
+            get_text("intel.error_loading", lang),
+            parse_mode=ParseMode.HTML,
+        )
 
 
 @router.callback_query(F.data.startswith("intel:"))
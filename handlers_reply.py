@@ -8,23 +8,25 @@ from aiogram.enums import ParseMode
 from aiogram.fsm.context import FSMContext
 from loguru import logger
 
-from services.user_service import resolve_user
+from database import db
+from repository import WalletRepository
+from services.user_service import UserResolverMiddleware
+from models import User
 from i18n import get_text
 from config import get_settings
-from keyboards import get_settings_keyboard
+from keyboards import get_settings_keyboard, get_wallet_list_keyboard
+from handlers_hot import get_hot_page_content
 
 router = Router(name="reply_nav")
+# Inner middleware: runs only once a menu button filter has matched
+router.message.middleware(UserResolverMiddleware())
 
 
 # ── Hot Today ────────────────────────────────────────
 
-@router.message(F.text.in_(["🔥 Hot", "🔥 Гарячі", "🔥 Горячие"]))
-async def reply_hot(message: Message) -> None:
-    user, lang = await resolve_user(message.from_user)
+async def reply_hot(message: Message, user: User, lang: str) -> None:
     await message.answer(get_text("loading", lang), parse_mode=ParseMode.HTML)
 
-    from handlers_hot import get_hot_page_content
-
     try:
         text, reply_markup = await get_hot_page_content(1, lang)
         
@@ -48,12 +50,7 @@ async def reply_hot(message: Message) -> None:
 
 # ── Wallets ──────────────────────────────────────────
 
-@router.message(F.text.in_(['📋 Wallets', '📋 Валлети', '📋 Кошельки']))
-async def reply_wallets(message: Message) -> None:
-    user, lang = await resolve_user(message.from_user)
-    from database import db
-    from repository import WalletRepository
-    from keyboards import get_wallet_list_keyboard
+async def reply_wallets(message: Message, user: User, lang: str) -> None:
 
     async with db.session() as session:
         repo = WalletRepository(session)
@@ -74,9 +71,7 @@ async def reply_wallets(message: Message) -> None:
 
 # ── Settings ─────────────────────────────────────────
 
-@router.message(F.text.in_(["⚙️ Settings", "⚙️ Налашт", "⚙️ Настройки"]))
-async def reply_settings(message: Message) -> None:
-    user, lang = await resolve_user(message.from_user)
+async def reply_settings(message: Message, user: User, lang: str) -> None:
     await message.answer(
         get_text("settings_menu", lang),
         reply_markup=get_settings_keyboard(lang),
@@ -86,12 +81,27 @@ async def reply_settings(message: Message) -> None:
 
 # ── Help ─────────────────────────────────────────────
 
-@router.message(F.text.in_(['❓ Help', '❓ Інфо', '❓ Помощь']))
-async def reply_help(message: Message) -> None:
-    user, lang = await resolve_user(message.from_user)
+async def reply_help(message: Message, user: User, lang: str) -> None:
     await message.answer(get_text("help_text", lang), parse_mode=ParseMode.HTML)
 
 
+# ── Dispatch ─────────────────────────────────────────
+
+# Every localized button label → its handler. One filter + dict lookup
+# instead of a chain of per-button F.text.in_ filters.
+_BUTTON_DISPATCH = {
+    "🔥 Hot": reply_hot, "🔥 Гарячі": reply_hot, "🔥 Горячие": reply_hot,
+    "📋 Wallets": reply_wallets, "📋 Валлети": reply_wallets, "📋 Кошельки": reply_wallets,
+    "⚙️ Settings": reply_settings, "⚙️ Налашт": reply_settings, "⚙️ Настройки": reply_settings,
+    "❓ Help": reply_help, "❓ Інфо": reply_help, "❓ Помощь": reply_help,
+}
+
+
+@router.message(F.text.in_(_BUTTON_DISPATCH))
+async def reply_menu_button(message: Message, user: User, lang: str) -> None:
+    await _BUTTON_DISPATCH[message.text](message, user, lang)
+
+
 def setup_reply_handlers(dp) -> None:
     dp.include_router(router)
     logger.info("Reply navigation handlers registered")
@@ -6,22 +6,26 @@ from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from aiogram.enums import ParseMode
 from loguru import logger
-import html
 
 from database import db
 from services.user_service import resolve_user
 from services.watchlist_service import WatchlistService
-from services.format_service import format_volume, format_price, format_signal_emoji
+from services.format_service import format_volume, format_price, format_signal_emoji, escape_html
 from i18n import get_text
-from keyboards import get_back_to_menu_keyboard
+from config import get_referral_link
+from keyboards import get_back_to_menu_keyboard, get_watchlist_keyboard
 from keyboards_intelligence import get_cached_market
 
 router = Router(name="watchlist")
 
 
+WATCHLIST_PAGE_SIZE = 20
+
+
 @router.callback_query(F.data == "menu:watchlist")
+@router.callback_query(F.data.startswith("wl:page:"))
 async def callback_watchlist(callback: CallbackQuery) -> None:
-    """Show user's watchlist."""
+    """Show user's watchlist, one page at a time."""
     user, lang = await resolve_user(callback.from_user)
 
     try:
@@ -29,8 +33,17 @@ async def callback_watchlist(callback: CallbackQuery) -> None:
     except Exception:
         pass
 
+    page = 0
+    if callback.data.startswith("wl:page:"):
+        try:
+            page = int(callback.data.split(":", 2)[2])
+        except ValueError:
+            page = 0
+
     async with db.session() as session:
-        items = await WatchlistService.get_all(session, user.id)
+        items, total, page = await WatchlistService.list_page(
+            session, user.id, page=page, limit=WATCHLIST_PAGE_SIZE,
+        )
 
     if not items:
         await callback.message.edit_text(
@@ -40,28 +53,22 @@ async def callback_watchlist(callback: CallbackQuery) -> None:
         )
         return
 
-    text = get_text("watchlist.title", lang) + f" ({len(items)})\n\n"
-
-    for i, item in enumerate(items[:20], 1):
-        q = html.escape(item.question[:60])
-        text += f"{i}. <b>{q}</b>\n"
-        from config import get_referral_link
-        market_url = get_referral_link(item.event_slug, item.market_slug)
-        text += f"   🔗 <a href='{market_url}'>"
-        text += f"Open</a>\n\n"
+    offset = page * WATCHLIST_PAGE_SIZE
+    has_more = offset + len(items) < total
+    parts = [get_text("watchlist.title", lang) + f" ({total})\n\n"]
+    _a = parts.append
 
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
+    urls = [get_referral_link(it.event_slug, it.market_slug) for it in items]
+    for i, (item, market_url) in enumerate(zip(items, urls), offset + 1):
+        q = escape_html(item.question[:60])
+        _a(f"{i}. <b>{q}</b>\n"
+           f"   🔗 <a href='{market_url}'>Open</a>\n\n")
 
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(
-        text=get_text("btn.back_to_menu", lang),
-        callback_data="menu:main",
-    ))
+    text = "".join(parts)
 
     await callback.message.edit_text(
         text,
-        reply_markup=builder.as_markup(),
+        reply_markup=get_watchlist_keyboard(lang, page, has_more),
         parse_mode=ParseMode.HTML,
         disable_web_page_preview=True,
     )
@@ -70,7 +77,7 @@ async def callback_watchlist(callback: CallbackQuery) -> None:
 @router.callback_query(F.data.startswith("wl:add:"))
 async def callback_watchlist_add(callback: CallbackQuery) -> None:
     """Add market to watchlist."""
-    cache_key = callback.data.split(":")[2]
+    _, _, cache_key = callback.data.split(":", 2)
     user, lang = await resolve_user(callback.from_user)
 
     market = get_cached_market(cache_key)
@@ -94,7 +101,7 @@ async def callback_watchlist_add(callback: CallbackQuery) -> None:
 @router.callback_query(F.data.startswith("wl:rm:"))
 async def callback_watchlist_remove(callback: CallbackQuery) -> None:
     """Remove market from watchlist."""
-    slug = callback.data.split(":")[2]
+    _, _, slug = callback.data.split(":", 2)
     user, lang = await resolve_user(callback.from_user)
 
     async with db.session() as session:
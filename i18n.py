@@ -15,14 +15,20 @@ Adding a new language:
 
 import json
 import os
-from typing import Dict, Any, Optional, Callable
+import string
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Callable, Tuple
 from pathlib import Path
 from loguru import logger
 
 
-SUPPORTED_LANGUAGES = ["en", "uk", "ru"]
+SUPPORTED_LANGUAGES = frozenset({"en", "uk", "ru"})
 DEFAULT_LANGUAGE = "en"
 
+_EMPTY: Mapping[str, str] = MappingProxyType({})
+
 
 class I18nService:
     """Loads and serves translations from JSON locale files."""
@@ -31,7 +37,10 @@ class I18nService:
         if locales_dir is None:
             locales_dir = os.path.join(os.path.dirname(__file__), "locales")
         self._locales_dir = Path(locales_dir)
-        self._translations: Dict[str, Dict[str, str]] = {}  # lang → {key: text}
+        # lang → read-only {key: text}; keys and texts are interned at load
+        self._translations: Dict[str, Mapping[str, str]] = {}
+        # lang → {key: placeholder names}; None = plain text, nothing to format
+        self._fields: Dict[str, Dict[str, Optional[FrozenSet[str]]]] = {}
         self._loaded = False
 
     def load(self) -> None:
@@ -44,9 +53,17 @@ class I18nService:
             with open(filepath, "r", encoding="utf-8") as f:
                 data = json.load(f)
             # Flatten nested dicts: {"btn": {"add": "Add"}} → {"btn.add": "Add"}
+            # Locale files are almost entirely flat dotted keys already, so
+            # top-level strings are copied straight in; only nested sections
+            # (e.g. "deep", "unified") go through the recursive walk.
             flat = {}
-            self._flatten(data, "", flat)
-            self._translations[lang] = flat
+            for k, v in data.items():
+                if isinstance(v, str):
+                    flat[sys.intern(k)] = sys.intern(v)
+                else:
+                    self._flatten(v, k, flat)
+            self._translations[lang] = MappingProxyType(flat)
+            self._fields[lang] = {k: self._parse_fields(v) for k, v in flat.items()}
             logger.info(f"Loaded {len(flat)} keys for locale '{lang}'")
 
         self._loaded = True
@@ -55,29 +72,59 @@ class I18nService:
     def _flatten(self, obj: Any, prefix: str, out: Dict[str, str]) -> None:
         if isinstance(obj, dict):
             for k, v in obj.items():
-                new_key = f"{prefix}.{k}" if prefix else k
+                new_key = sys.intern(f"{prefix}.{k}" if prefix else k)
                 self._flatten(v, new_key, out)
         else:
-            out[prefix] = str(obj)
+            out[prefix] = sys.intern(str(obj))
+
+    @staticmethod
+    def _parse_fields(text: str) -> Optional[FrozenSet[str]]:
+        """Placeholder root names in a template, parsed once at load.
+
+        Returns None for plain text (no braces) or a malformed template,
+        so get() can return it as-is without calling str.format.
+        """
+        if "{" not in text and "}" not in text:
+            return None
+        try:
+            return frozenset(
+                name.split(".", 1)[0].split("[", 1)[0]
+                for _, name, _, _ in string.Formatter().parse(text)
+                if name is not None
+            )
+        except ValueError:
+            return None
 
     def get(self, key: str, lang: str = DEFAULT_LANGUAGE, **kwargs) -> str:
         """Get translated string. Falls back to EN, then returns key."""
         if not self._loaded:
             self.load()
 
-        # Try requested language
-        text = self._translations.get(lang, {}).get(key)
+        # Try requested language (unknown languages go straight to EN)
+        t = self._translations
+        default = t.get(DEFAULT_LANGUAGE, _EMPTY)
+        table = t.get(lang) or default
+        src = lang if table is not default else DEFAULT_LANGUAGE
+        text = table.get(key)
         # Fallback to EN
-        if text is None and lang != DEFAULT_LANGUAGE:
-            text = self._translations.get(DEFAULT_LANGUAGE, {}).get(key)
+        if text is None and table is not default:
+            src = DEFAULT_LANGUAGE
+            text = default.get(key)
         # Fallback to raw key
         if text is None:
             logger.warning(f"Missing translation: [{lang}] {key}")
             return f"[{key}]"
 
         if kwargs:
+            fields = self._fields[src][key]
+            if fields is None:
+                return text
+            missing = fields.difference(kwargs)
+            if missing:
+                logger.warning(f"Format error for [{lang}] {key}: missing {sorted(missing)}")
+                return text
             try:
-                return text.format(**kwargs)
+                return text.format_map(kwargs)
             except (KeyError, IndexError) as e:
                 logger.warning(f"Format error for [{lang}] {key}: {e}")
                 return text
@@ -108,6 +155,17 @@ def get_text(key: str, lang: str = "en", **kwargs) -> str:
     return i18n.get(key, lang, **kwargs)
 
 
+@lru_cache(maxsize=512)
+def get_texts(lang: str, *keys: str) -> Tuple[str, ...]:
+    """Plain labels for several keys in one call, memoized per (lang, keys).
+
+    For keyboards that need a fixed set of unformatted strings:
+        positions, trades = get_texts(lang, "btn.view_positions", "btn.recent_trades")
+    Locales are loaded once at import, so entries never go stale.
+    """
+    return tuple(i18n.get(key, lang) for key in keys)
+
+
 def get_side_text(side: str, lang: str = "en") -> str:
     if side.upper() == "BUY":
         return get_text("trade.side_buy", lang)
@@ -11,24 +11,34 @@ Two keyboard types:
    - Disappears when message scrolls up — that's OK, persistent nav below
 
 This separation ensures users always have navigation access.
+
+Keyboards that depend only on (lang[, wallet_id]) are built once and
+shared (module constants / lru_cache). Callers must treat the returned
+markup as read-only — never append rows to it; build a new keyboard
+instead.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 from aiogram.types import (
     InlineKeyboardMarkup, InlineKeyboardButton,
     ReplyKeyboardMarkup, KeyboardButton,
 )
-from aiogram.utils.keyboard import InlineKeyboardBuilder, ReplyKeyboardBuilder
+from aiogram.utils.keyboard import ReplyKeyboardBuilder
 
-from i18n import get_text
+from config import get_profile_link
+from i18n import get_text, get_texts
 
 
 # =====================================================================
 # REPLY KEYBOARDS (persistent, under input field)
 # =====================================================================
 
+@lru_cache(maxsize=8)
 def get_persistent_menu(lang: str) -> ReplyKeyboardMarkup:
     """Main persistent reply keyboard — always visible.
+
+    One shared markup per language (read-only — see module docstring).
     
     Layout:
     [ 📊 Signals ] [ 🔥 Hot ]  [ 🔗 Analyze ]
@@ -56,209 +66,274 @@ def get_persistent_menu(lang: str) -> ReplyKeyboardMarkup:
 # INLINE KEYBOARDS (attached to specific messages)
 # =====================================================================
 
-def get_language_keyboard() -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(text="🇬🇧 English", callback_data="lang:en"))
-    builder.row(InlineKeyboardButton(text="🇺🇦 Українська", callback_data="lang:uk"))
-    builder.row(InlineKeyboardButton(text="🇷🇺 Русский", callback_data="lang:ru"))
-    return builder.as_markup()
+_CALLBACK_MAX_BYTES = 64  # Telegram's callback_data limit (bytes, not chars)
 
 
-def get_main_menu_keyboard(lang: str) -> InlineKeyboardMarkup:
-    """Inline quick-action menu (shown in welcome message)."""
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text=get_text("btn.add_wallet", lang), callback_data="menu:add_wallet"),
-        InlineKeyboardButton(text=get_text("btn.my_wallets", lang), callback_data="menu:my_wallets"),
-    )
+def _fit_callback(prefix: str, value: str) -> str:
+    """prefix + value, with value cut to fit the callback_data byte limit.
 
-    builder.row(
-        InlineKeyboardButton(text=get_text("btn.analyze_link", lang), callback_data="menu:analyze_link"),
-    )
-    builder.row(
-        InlineKeyboardButton(text=get_text("btn.hot_today", lang), callback_data="intel:hot"),
-    )
-    builder.row(
-        InlineKeyboardButton(text=get_text("btn.settings", lang), callback_data="menu:settings"),
-        InlineKeyboardButton(text=get_text("btn.help", lang), callback_data="menu:help"),
-    )
-    return builder.as_markup()
+    For payloads carrying free text (e.g. a detected profile name): a
+    non-ASCII name can blow the limit long before any char-count cap.
+    """
+    room = _CALLBACK_MAX_BYTES - len(prefix.encode())
+    return prefix + value.encode()[:room].decode("utf-8", "ignore")
+
+
+def _btn(
+    text: str, callback_data: Optional[str] = None, url: Optional[str] = None,
+) -> InlineKeyboardButton:
+    """InlineKeyboardButton without pydantic validation.
+
+    Only for buttons whose fields this module controls (fixed callback
+    prefixes + ids, our own URLs). Anything carrying user-supplied
+    callback data goes through the validating constructor instead.
+    """
+    if url is not None:
+        return InlineKeyboardButton.model_construct(text=text, url=url)
+    return InlineKeyboardButton.model_construct(text=text, callback_data=callback_data)
+
+
+# Buttons that are identical wherever they appear — one instance per language,
+# shared by every keyboard that includes them.
+
+@lru_cache(maxsize=16)
+def _cancel_btn(lang: str) -> InlineKeyboardButton:
+    return _btn(get_text("btn.cancel", lang), "action:cancel")
+
+
+@lru_cache(maxsize=16)
+def _back_to_menu_btn(lang: str) -> InlineKeyboardButton:
+    return _btn(get_text("btn.back_to_menu", lang), "menu:main")
+
+
+def _build_language_keyboard() -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_btn("🇬🇧 English", "lang:en")],
+        [_btn("🇺🇦 Українська", "lang:uk")],
+        [_btn("🇷🇺 Русский", "lang:ru")],
+    ])
 
 
+# No i18n involved — built once at import and shared
+_LANGUAGE_KB = _build_language_keyboard()
+
+
+def get_language_keyboard() -> InlineKeyboardMarkup:
+    return _LANGUAGE_KB
+
+
+@lru_cache(maxsize=16)
+def get_main_menu_keyboard(lang: str) -> InlineKeyboardMarkup:
+    """Inline quick-action menu (shown in welcome message)."""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [
+            _btn(get_text("btn.add_wallet", lang), "menu:add_wallet"),
+            _btn(get_text("btn.my_wallets", lang), "menu:my_wallets"),
+        ],
+        [_btn(get_text("btn.analyze_link", lang), "menu:analyze_link")],
+        [_btn(get_text("btn.hot_today", lang), "intel:hot")],
+        [
+            _btn(get_text("btn.settings", lang), "menu:settings"),
+            _btn(get_text("btn.help", lang), "menu:help"),
+        ],
+    ])
+
+
+@lru_cache(maxsize=16)
 def get_cancel_keyboard(lang: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(
-        text=get_text("btn.cancel", lang), callback_data="action:cancel",
-    ))
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_cancel_btn(lang)],
+    ])
 
 
+@lru_cache(maxsize=16)
 def get_back_to_menu_keyboard(lang: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(
-        text=get_text("btn.back_to_menu", lang), callback_data="menu:main",
-    ))
-    return builder.as_markup()
+    """Single "back to menu" button — one shared markup per language."""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_back_to_menu_btn(lang)],
+    ])
+
+
+def get_watchlist_keyboard(lang: str, page: int, has_more: bool) -> InlineKeyboardMarkup:
+    """Watchlist pager — prev/next only where there is a page to go to."""
+    nav = []
+    if page > 0:
+        nav.append(_btn(get_text("btn.prev_page", lang), f"wl:page:{page - 1}"))
+    if has_more:
+        nav.append(_btn(get_text("btn.next_page", lang), f"wl:page:{page + 1}"))
+    keyboard = [nav] if nav else []
+    keyboard.append([_back_to_menu_btn(lang)])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
 def get_nickname_keyboard(
     lang: str, wallet_address: str, detected_name: Optional[str] = None,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    keyboard = []
     if detected_name:
-        builder.row(InlineKeyboardButton(
+        keyboard.append([InlineKeyboardButton(
             text=get_text("btn.use_detected_name", lang, name=detected_name),
-            callback_data=f"nickname:use:{detected_name[:50]}",
-        ))
-    short = f"{wallet_address[:6]}...{wallet_address[-4:]}"
-    builder.row(InlineKeyboardButton(
+            callback_data=_fit_callback("nickname:use:", detected_name),
+        )])
+    short = wallet_address[:6] + "..." + wallet_address[-4:]
+    keyboard.append([InlineKeyboardButton(
         text=get_text("btn.use_address", lang),
         callback_data=f"nickname:addr:{short}",
-    ))
-    builder.row(InlineKeyboardButton(
-        text=get_text("btn.cancel", lang), callback_data="action:cancel",
-    ))
-    return builder.as_markup()
+    )])
+    keyboard.append([_cancel_btn(lang)])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
 def get_wallet_list_keyboard(lang: str, wallets) -> InlineKeyboardMarkup:
-    from config import get_settings
-    settings = get_settings()
-    builder = InlineKeyboardBuilder()
-    for w in wallets:
-        icon = "⏸️" if w.is_paused else "👤"
-        short_addr = f"{w.wallet_address[:6]}…{w.wallet_address[-4:]}"
-        # Row: [wallet name + short address] [🔗 direct profile link]
-        profile_url = f"https://polymarket.com/profile/{w.wallet_address}"
-        if settings.polymarket_referral_code:
-            profile_url += f"?via={settings.polymarket_referral_code}"
-        builder.row(
-            InlineKeyboardButton(
-                text=f"{icon} {w.nickname} ({short_addr})",
-                callback_data=f"wallet:view:{w.id}",
-            ),
-            InlineKeyboardButton(
-                text="🔗",
-                url=profile_url,
+    # Row per wallet: [wallet name + short address] [🔗 direct profile link]
+    rows = [
+        [
+            _btn(
+                f"{'⏸️' if w.is_paused else '👤'} {w.nickname} ({w.short_address})",
+                f"wallet:view:{w.id}",
             ),
-        )
-    builder.row(InlineKeyboardButton(
-        text=get_text("btn.add_wallet", lang), callback_data="menu:add_wallet",
-    ))
-    builder.row(InlineKeyboardButton(
-        text=get_text("btn.back_to_menu", lang), callback_data="menu:main",
-    ))
-    return builder.as_markup()
+            _btn("🔗", url=w.profile_url),
+        ]
+        for w in wallets
+    ]
+    rows.append([_btn(get_text("btn.add_wallet", lang), "menu:add_wallet")])
+    rows.append([_back_to_menu_btn(lang)])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 def get_wallet_details_keyboard(
     lang: str, wallet_id: int, wallet_address: str = "",
 ) -> InlineKeyboardMarkup:
-    from config import get_settings
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text=get_text("btn.view_positions", lang), callback_data=f"wallet:positions:{wallet_id}"),
-        InlineKeyboardButton(text=get_text("btn.recent_trades", lang), callback_data=f"wallet:trades:{wallet_id}"),
+    positions, trades, stats, profile, settings, remove, back = get_texts(
+        lang,
+        "btn.view_positions", "btn.recent_trades", "btn.view_detailed_stats",
+        "btn.view_profile", "btn.wallet_settings", "btn.remove_wallet", "btn.back",
     )
-    builder.row(InlineKeyboardButton(
-        text=get_text("btn.view_detailed_stats", lang), callback_data=f"wallet:stats_range:{wallet_id}",
-    ))
+    wid = str(wallet_id)  # shared by every per-wallet callback below
+    rows = [
+        [
+            _btn(positions, "wallet:positions:" + wid),
+            _btn(trades, "wallet:trades:" + wid),
+        ],
+        [_btn(stats, "wallet:stats_range:" + wid)],
+    ]
     if wallet_address:
-        settings = get_settings()
-        url = f"https://polymarket.com/profile/{wallet_address}"
-        if settings.polymarket_referral_code:
-            url += f"?via={settings.polymarket_referral_code}"
-        builder.row(InlineKeyboardButton(text=get_text("btn.view_profile", lang), url=url))
-    builder.row(
-        InlineKeyboardButton(text=get_text("btn.wallet_settings", lang), callback_data=f"wallet:settings:{wallet_id}"),
-        InlineKeyboardButton(text=get_text("btn.remove_wallet", lang), callback_data=f"wallet:remove:{wallet_id}"),
-    )
-    builder.row(InlineKeyboardButton(text=get_text("btn.back", lang), callback_data="menu:my_wallets"))
-    return builder.as_markup()
+        rows.append([_btn(profile, url=get_profile_link(wallet_address))])
+    rows.append([
+        _btn(settings, "wallet:settings:" + wid),
+        _btn(remove, "wallet:remove:" + wid),
+    ])
+    rows.append([_btn(back, "menu:my_wallets")])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
+@lru_cache(maxsize=4096)
 def get_wallet_settings_keyboard(lang: str, wallet_id: int, is_paused: bool) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
     if is_paused:
-        builder.row(InlineKeyboardButton(text=get_text("btn.resume_wallet", lang), callback_data=f"wallet:resume:{wallet_id}"))
+        toggle = _btn(get_text("btn.resume_wallet", lang), f"wallet:resume:{wallet_id}")
     else:
-        builder.row(InlineKeyboardButton(text=get_text("btn.pause_wallet", lang), callback_data=f"wallet:pause:{wallet_id}"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.set_min_amount", lang), callback_data=f"wallet:min_amount:{wallet_id}"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.back", lang), callback_data=f"wallet:view:{wallet_id}"))
-    return builder.as_markup()
+        toggle = _btn(get_text("btn.pause_wallet", lang), f"wallet:pause:{wallet_id}")
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [toggle],
+        [_btn(get_text("btn.set_min_amount", lang), f"wallet:min_amount:{wallet_id}")],
+        [_btn(get_text("btn.back", lang), f"wallet:view:{wallet_id}")],
+    ])
+
+
+# Notification thresholds offered on the min-amount screen, in button order
+_MIN_AMOUNT_KEYS = (
+    "btn.min_amount_0", "btn.min_amount_100", "btn.min_amount_500",
+    "btn.min_amount_1000", "btn.min_amount_5000", "btn.min_amount_10000",
+)
 
 
+@lru_cache(maxsize=4096)
 def get_min_amount_keyboard(lang: str, wallet_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(text=get_text("btn.min_amount_0", lang), callback_data=f"set_min:0:{wallet_id}"))
-    builder.row(
-        InlineKeyboardButton(text=get_text("btn.min_amount_100", lang), callback_data=f"set_min:100:{wallet_id}"),
-        InlineKeyboardButton(text=get_text("btn.min_amount_500", lang), callback_data=f"set_min:500:{wallet_id}"),
-    )
-    builder.row(
-        InlineKeyboardButton(text=get_text("btn.min_amount_1000", lang), callback_data=f"set_min:1000:{wallet_id}"),
-        InlineKeyboardButton(text=get_text("btn.min_amount_5000", lang), callback_data=f"set_min:5000:{wallet_id}"),
-    )
-    builder.row(InlineKeyboardButton(text=get_text("btn.min_amount_10000", lang), callback_data=f"set_min:10000:{wallet_id}"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.back", lang), callback_data=f"wallet:settings:{wallet_id}"))
-    return builder.as_markup()
-
-
+    l0, l100, l500, l1000, l5000, l10000, back = get_texts(lang, *_MIN_AMOUNT_KEYS, "btn.back")
+    wid = str(wallet_id)
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_btn(l0, "set_min:0:" + wid)],
+        [_btn(l100, "set_min:100:" + wid), _btn(l500, "set_min:500:" + wid)],
+        [_btn(l1000, "set_min:1000:" + wid), _btn(l5000, "set_min:5000:" + wid)],
+        [_btn(l10000, "set_min:10000:" + wid)],
+        [_btn(back, "wallet:settings:" + wid)],
+    ])
+
+
+@lru_cache(maxsize=4096)
 def get_confirm_remove_keyboard(lang: str, wallet_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(text=get_text("btn.confirm_remove", lang), callback_data=f"wallet:confirm_remove:{wallet_id}"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.cancel", lang), callback_data=f"wallet:view:{wallet_id}"))
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_btn(get_text("btn.confirm_remove", lang), f"wallet:confirm_remove:{wallet_id}")],
+        [_btn(get_text("btn.cancel", lang), f"wallet:view:{wallet_id}")],
+    ])
 
 
+@lru_cache(maxsize=4096)
 def get_wallet_back_keyboard(lang: str, wallet_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(text=get_text("btn.back", lang), callback_data=f"wallet:view:{wallet_id}"))
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_btn(get_text("btn.back", lang), f"wallet:view:{wallet_id}")],
+    ])
 
 
+@lru_cache(maxsize=16)
 def get_settings_keyboard(lang: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(text=get_text("btn.change_language", lang), callback_data="settings:language"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.back_to_menu", lang), callback_data="menu:main"))
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_btn(get_text("btn.change_language", lang), "settings:language")],
+        [_back_to_menu_btn(lang)],
+    ])
 
 
+@lru_cache(maxsize=16)
 def get_settings_language_keyboard(lang: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(text="🇬🇧 English", callback_data="setlang:en"))
-    builder.row(InlineKeyboardButton(text="🇺🇦 Українська", callback_data="setlang:uk"))
-    builder.row(InlineKeyboardButton(text="🇷🇺 Русский", callback_data="setlang:ru"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.back", lang), callback_data="menu:settings"))
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_btn("🇬🇧 English", "setlang:en")],
+        [_btn("🇺🇦 Українська", "setlang:uk")],
+        [_btn("🇷🇺 Русский", "setlang:ru")],
+        [_btn(get_text("btn.back", lang), "menu:settings")],
+    ])
+
+
+# Stats range picker: (i18n key, days) in button order
+_STATS_RANGE_SPECS = (
+    ("btn.stats_1_day", 1),
+    ("btn.stats_1_week", 7),
+    ("btn.stats_1_month", 30),
+    ("btn.stats_all_time", 365),
+)
 
 
+@lru_cache(maxsize=4096)
 def get_stats_range_keyboard(lang: str, wallet_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(InlineKeyboardButton(text=get_text("btn.stats_1_day", lang), callback_data=f"stats_range:1:{wallet_id}"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.stats_1_week", lang), callback_data=f"stats_range:7:{wallet_id}"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.stats_1_month", lang), callback_data=f"stats_range:30:{wallet_id}"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.stats_all_time", lang), callback_data=f"stats_range:365:{wallet_id}"))
-    builder.row(InlineKeyboardButton(text=get_text("btn.back", lang), callback_data=f"wallet:view:{wallet_id}"))
-    return builder.as_markup()
+    *labels, back = get_texts(lang, *(key for key, _ in _STATS_RANGE_SPECS), "btn.back")
+    wid = str(wallet_id)
+    rows = [
+        [_btn(label, f"stats_range:{days}:{wid}")]
+        for label, (_, days) in zip(labels, _STATS_RANGE_SPECS)
+    ]
+    rows.append([_btn(back, "wallet:view:" + wid)])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+@lru_cache(maxsize=16)
+def get_back_to_results_keyboard(lang: str) -> InlineKeyboardMarkup:
+    """Back from a market's deep research to the /analyze results list."""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_btn(get_text("btn.back", lang), "back_to_results")],
+    ])
+
+
+# Pre-formatted "🔍 1".."🔍 10" labels (the results list shows the top 5)
+_SELECT_LABELS = tuple(f"🔍 {i}" for i in range(1, 11))
 
 
 def get_markets_selection_keyboard(lang: str, count: int) -> InlineKeyboardMarkup:
     """Keyboard for selecting a market for deep research."""
-    builder = InlineKeyboardBuilder()
-    row = []
-    for i in range(count):
-        # Callback: sel_mk:INDEX
-        row.append(InlineKeyboardButton(
-            text=f"🔍 {i+1}", 
-            callback_data=f"sel_mk:{i}"
-        ))
-        if len(row) == 3: # 3 buttons per row
-            builder.row(*row)
-            row = []
-    if row:
-        builder.row(*row)
-            
-    builder.row(InlineKeyboardButton(text=get_text("btn.back_to_menu", lang), callback_data="menu:analyze_link"))
-    return builder.as_markup()
+    # Callback: sel_mk:INDEX, 3 buttons per row
+    buttons = [
+        _btn(_SELECT_LABELS[i] if i < len(_SELECT_LABELS) else f"🔍 {i+1}", f"sel_mk:{i}")
+        for i in range(count)
+    ]
+    keyboard = [buttons[i:i + 3] for i in range(0, len(buttons), 3)]
+    keyboard.append([_btn(get_text("btn.back_to_menu", lang), "menu:analyze_link")])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
     
\ No newline at end of file
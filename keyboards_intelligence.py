@@ -8,196 +8,245 @@ Changes from v2:
 """
 
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 
-from market_intelligence import MarketStats, Category, TimeFrame
+from market_intelligence import MarketStats
 from i18n import get_text
 
+__all__ = [
+    "get_cached_market",
+    "get_category_keyboard",
+    "get_market_detail_keyboard",
+    "get_deep_analysis_keyboard",
+]
+
 
 # =====================================================================
 # Market cache with TTL
 # =====================================================================
 
-_market_cache: Dict[str, Tuple[MarketStats, float]] = {}  # key → (market, expires_at)
+class _Entry:
+    """Cached market + absolute expiry. Slotted: no per-entry __dict__."""
+
+    __slots__ = ("market", "exp")
+
+    def __init__(self, market: MarketStats, exp: float):
+        self.market = market
+        self.exp = exp
+
+
+# Keys are ints internally (cheap to hash, nothing retained per entry);
+# only the callback payload carries them as base36 text.
+# key → entry, kept in LRU order (least recently used first)
+_market_cache: "OrderedDict[int, _Entry]" = OrderedDict()
+_cid_to_key: Dict[str, int] = {}  # condition_id → latest key, for the watchlist button
 _cache_counter = 0
+_B36 = "0123456789abcdefghijklmnopqrstuvwxyz"
+_KEY_SPACE = 36 ** 5  # keys stay ≤ 5 chars in callback_data ("intel:m:" + key)
 _CACHE_TTL = 900  # 15 minutes
+_CACHE_MAX_SIZE = 10_000  # hard cap; oldest entries are evicted first
+_CLEANUP_INTERVAL = 60.0  # full expiry sweep at most once a minute
+_last_cleanup = 0.0
+
+
+def _b36(n: int) -> str:
+    """Base36-encode a non-negative int (short, callback_data-safe key).
+
+    Decoding is the builtin int(key, 36).
+    """
+    if n == 0:
+        return _B36[0]
+    out = []
+    while n:
+        n, r = divmod(n, 36)
+        out.append(_B36[r])
+    return "".join(reversed(out))
+
+
+def _unindex(key: int, entry: _Entry) -> None:
+    """Release the reverse-index slot for a removed entry (if it still owns it)."""
+    cid = entry.market.condition_id
+    if _cid_to_key.get(cid) == key:
+        del _cid_to_key[cid]
+
+
+def _drop(key: int) -> None:
+    """Remove one entry and its reverse-index slot."""
+    _unindex(key, _market_cache.pop(key))
 
 
 def _cleanup_cache() -> None:
-    """Remove expired entries."""
+    """Remove expired entries (amortized: sweeps at most every _CLEANUP_INTERVAL)."""
+    global _last_cleanup
     now = time.time()
-    expired = [k for k, (_, exp) in _market_cache.items() if exp < now]
+    if now - _last_cleanup < _CLEANUP_INTERVAL:
+        return
+    _last_cleanup = now
+    expired = [k for k, entry in _market_cache.items() if entry.exp < now]
     for k in expired:
-        del _market_cache[k]
+        _drop(k)
 
 
 def cache_markets(markets: List[MarketStats]) -> List[str]:
-    """Cache markets with TTL. Returns short keys."""
+    """Cache markets with TTL. Returns short keys (one stable key per market).
+
+    The cache stores references, not copies: get_cached_market hands the
+    same MarketStats to every handler, so callers must not mutate it.
+    """
     global _cache_counter
     _cleanup_cache()
 
     now = time.time()
     keys = []
     for market in markets:
-        _cache_counter += 1
-        key = str(_cache_counter % 100_000_000)
-        _market_cache[key] = (market, now + _CACHE_TTL)
-        keys.append(key)
+        # Already cached (page flip / refresh): reuse its key, refresh expiry
+        existing = _cid_to_key.get(market.condition_id)
+        entry = _market_cache.get(existing) if existing is not None else None
+        if entry is not None:
+            entry.market, entry.exp = market, now + _CACHE_TTL
+            _market_cache.move_to_end(existing)
+            keys.append(_b36(existing))
+            continue
+
+        # After wraparound a counter value may still name a live entry;
+        # never overwrite it (a stale button would open the wrong market).
+        # The cache holds ≤ _CACHE_MAX_SIZE keys, so this skips at most that many.
+        while True:
+            _cache_counter += 1
+            key = _cache_counter % _KEY_SPACE
+            if key not in _market_cache:
+                break
+        _market_cache[key] = _Entry(market, now + _CACHE_TTL)
+        _cid_to_key[market.condition_id] = key
+        keys.append(_b36(key))
+
+    # LRU order is also expiry order (every touch renews the same TTL),
+    # so popping from the front drops the entries closest to expiring.
+    while len(_market_cache) > _CACHE_MAX_SIZE:
+        _unindex(*_market_cache.popitem(last=False))
     return keys
 
 
 def get_cached_market(key: str) -> Optional[MarketStats]:
-    """Get market from cache. Returns None if expired or missing."""
+    """Get market from cache. Returns None if expired or missing.
+
+    A hit slides the entry's expiry forward (LRU-style): markets a user
+    is actively clicking through stay resolvable, idle ones age out.
+    """
     _cleanup_cache()
-    entry = _market_cache.get(key)
-    if entry:
-        return entry[0]
-    return None
+    try:
+        key_int = int(key, 36)
+    except ValueError:  # malformed / foreign callback payload
+        return None
+    entry = _market_cache.get(key_int)
+    now = time.time()
+    # Entries can outlive their TTL until the next sweep — check inline
+    if entry is None or entry.exp < now:
+        return None
+    entry.exp = now + _CACHE_TTL
+    _market_cache.move_to_end(key_int)
+    return entry.market
 
 
 # =====================================================================
 # Keyboards
 # =====================================================================
 
+# Category grid: (emoji, i18n key, callback value), two per row
+_CATEGORY_ROWS: Tuple[Tuple[Tuple[str, str, str], ...], ...] = (
+    (("🏛️", "cat.politics", "politics"), ("⚽", "cat.sports", "sports")),
+    (("🎬", "cat.pop_culture", "pop-culture"), ("💼", "cat.business", "business")),
+    (("₿", "cat.crypto", "crypto"), ("🔬", "cat.science", "science")),
+    (("🎮", "cat.gaming", "gaming"), ("🎭", "cat.entertainment", "entertainment")),
+    (("🌍", "cat.world", "world"), ("💻", "cat.tech", "tech")),
+)
+
+# Every fixed label the category / market-detail keyboards use
+_LABEL_KEYS = (
+    "btn.back", "btn.back_to_menu", "intel.link_text", "watchlist.btn_add",
+)
+
+
+@lru_cache(maxsize=8)
+def _labels(lang: str) -> Dict[str, str]:
+    """Resolved labels for one language — built once, read-only after."""
+    return {key: get_text(key, lang) for key in _LABEL_KEYS}
+
+
+@lru_cache(maxsize=64)
+def _nav_btn(lang: str, label_key: str, callback_data: str) -> InlineKeyboardButton:
+    """Static navigation button (back / menu) — one shared instance
+    per (lang, label, target), reused across every keyboard that shows it."""
+    return InlineKeyboardButton(text=_labels(lang)[label_key], callback_data=callback_data)
+
+
+@lru_cache(maxsize=1024)
+def _open_market_btn(lang: str, url: str) -> InlineKeyboardButton:
+    """Market link button — validated once per (lang, url).
+
+    Cached markets are re-rendered many times; keying on the URL (not the
+    MarketStats instance) keeps the cache valid across market refreshes.
+    """
+    return InlineKeyboardButton(text=_labels(lang)["intel.link_text"], url=url)
+
+
+@lru_cache(maxsize=16)
 def get_category_keyboard(lang: str) -> InlineKeyboardMarkup:
-    """Category selection keyboard."""
-    builder = InlineKeyboardBuilder()
-
-    rows = [
-        [("🏛️", "cat.politics", "politics"), ("⚽", "cat.sports", "sports")],
-        [("🎬", "cat.pop_culture", "pop-culture"), ("💼", "cat.business", "business")],
-        [("₿", "cat.crypto", "crypto"), ("🔬", "cat.science", "science")],
-        [("🎮", "cat.gaming", "gaming"), ("🎭", "cat.entertainment", "entertainment")],
-        [("🌍", "cat.world", "world"), ("💻", "cat.tech", "tech")],
-    ]
+    """Category selection keyboard.
 
-    for row in rows:
-        buttons = [
+    Depends only on lang, so one markup per language is built and shared;
+    callers must not mutate it.
+    """
+    keyboard = [
+        [
             InlineKeyboardButton(
                 text=f"{emoji} {get_text(text_key, lang)}",
                 callback_data=f"intel:cat:{cat_val}",
             )
             for emoji, text_key, cat_val in row
         ]
-        builder.row(*buttons)
-
-    builder.row(
-        InlineKeyboardButton(
-            text=f"📊 {get_text('cat.all', lang)}",
-            callback_data="intel:cat:all",
-        )
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text=get_text("btn.back_to_menu", lang),
-            callback_data="menu:main",
-        )
-    )
-    return builder.as_markup()
-
-
-def get_trending_keyboard(
-    lang: str,
-    markets: List[MarketStats],
-    category: str,
-    timeframe: str,
-    page: int = 1,
-    total_pages: int = 1,
-) -> InlineKeyboardMarkup:
-    """Market list with numbered buttons + pagination."""
-    builder = InlineKeyboardBuilder()
-
-    keys = cache_markets(markets)
-    start_index = (page - 1) * 10 + 1
-
-    # Market buttons (5 per row)
-    row = []
-    for i, key in enumerate(keys):
-        row.append(
-            InlineKeyboardButton(
-                text=str(start_index + i),
-                callback_data=f"intel:m:{key}",
-            )
-        )
-        if len(row) == 5:
-            builder.row(*row)
-            row = []
-    if row:
-        builder.row(*row)
-
-    # Pagination
-    nav = []
-    if page > 1:
-        nav.append(InlineKeyboardButton(
-            text=get_text("btn.prev_page", lang),
-            callback_data=f"intel:p:{category}:{timeframe}:{page - 1}",
-        ))
-    nav.append(InlineKeyboardButton(
-        text=f"📄 {page}/{total_pages}", callback_data="noop",
-    ))
-    if page < total_pages:
-        nav.append(InlineKeyboardButton(
-            text=get_text("btn.next_page", lang),
-            callback_data=f"intel:p:{category}:{timeframe}:{page + 1}",
-        ))
-    builder.row(*nav)
-
-    # Refresh
-    builder.row(
-        InlineKeyboardButton(
-            text=get_text("btn.refresh", lang),
-            callback_data="intel:hot",
-        )
-    )
-
-    # Navigation
-    builder.row(
-        InlineKeyboardButton(
-            text=get_text("btn.back", lang),
-            callback_data="menu:main",
-        ),
-    )
-    return builder.as_markup()
+        for row in _CATEGORY_ROWS
+    ]
+    keyboard.append([InlineKeyboardButton(
+        text=f"📊 {get_text('cat.all', lang)}", callback_data="intel:cat:all",
+    )])
+    keyboard.append([_nav_btn(lang, "btn.back_to_menu", "menu:main")])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
 def get_market_detail_keyboard(
     lang: str, market: MarketStats,
 ) -> InlineKeyboardMarkup:
     """Keyboard for market detail view — with Watchlist button."""
-    builder = InlineKeyboardBuilder()
+    labels = _labels(lang)
+    keyboard = []
 
     # Watchlist button — uses the last cache key for this market
     # We store slug for the watchlist add handler
-    cache_key = None
-    for k, (m, _) in _market_cache.items():
-        if m.condition_id == market.condition_id:
-            cache_key = k
-            break
-
-    if cache_key:
-        builder.row(
-            InlineKeyboardButton(
-                text=get_text("watchlist.btn_add", lang),
-                callback_data=f"wl:add:{cache_key}",
-            )
-        )
-
-    builder.row(
-        InlineKeyboardButton(
-            text=get_text("intel.link_text", lang),
-            url=market.market_url,
-        )
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text=get_text("btn.back", lang),
-            callback_data="intel:hot",  # Back to Hot Today list instead of categories
-        ),
-        InlineKeyboardButton(
-            text=get_text("btn.back_to_menu", lang),
-            callback_data="menu:main",
-        ),
-    )
-    return builder.as_markup()
+    cache_key = _cid_to_key.get(market.condition_id)
+
+    if cache_key is not None:
+        keyboard.append([InlineKeyboardButton(
+            text=labels["watchlist.btn_add"], callback_data=f"wl:add:{_b36(cache_key)}",
+        )])
+
+    keyboard.append([_open_market_btn(lang, market.market_url)])
+    keyboard.append([
+        _nav_btn(lang, "btn.back", "intel:hot"),  # Back to Hot Today list instead of categories
+        _nav_btn(lang, "btn.back_to_menu", "menu:main"),
+    ])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
+def get_deep_analysis_keyboard(lang: str, market: MarketStats) -> InlineKeyboardMarkup:
+    """Keyboard under a deep-analysis result: market link + navigation."""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [_open_market_btn(lang, market.market_url)],
+        [
+            _nav_btn(lang, "btn.back", "intel:back_categories"),
+            _nav_btn(lang, "btn.back_to_menu", "menu:main"),
+        ],
+    ])
@@ -58,6 +58,9 @@ async def main() -> None:
     except Exception as e:
         logger.warning(f"Table sync warning (non-fatal): {e}")
 
+    # Market Intelligence HTTP session — opened once, not lazily per request
+    await market_intelligence.init()
+
     # 4. Bot + Dispatcher
     bot = Bot(
         token=settings.bot_token,
@@ -86,6 +89,7 @@ async def main() -> None:
         if notification_service:
             await notification_service.stop()
         await api_client.close()
+        await market_intelligence.close()
         # Close analytics data fetcher
         try:
             from analytics.data_fetcher import data_fetcher as analytics_fetcher
@@ -14,6 +14,7 @@ Key changes vs v1:
 """
 
 import asyncio
+import heapq
 import time as _time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -148,9 +149,15 @@ class WhaleAnalysis:
         return f"in last {self.window_hours // 24}d"
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketStats:
-    """Statistics for a single market."""
+    """Statistics for a single market.
+
+    Slotted: no per-instance __dict__ (these are held by the hundreds in
+    the trending and keyboard caches), and unknown attributes can't be
+    bolted on. Instances handed out by caches are shared — treat as
+    read-only once the signal has been calculated.
+    """
     condition_id: str
     question: str
     slug: str
@@ -266,6 +273,10 @@ class MarketIntelligenceEngine:
     WHALE_THRESHOLD = 5000    # $5000+ = large whale
     MIN_VOLUME_24H = 1000     # Minimum 24h vol to show in trending
     WHALE_WINDOW_HOURS = 24   # Default analysis window
+    ENRICH_CONCURRENCY = 8    # Parallel per-market enrichments
+
+    # --- Trending results cache (in-memory) ---
+    TRENDING_CACHE_TTL = 60   # seconds
 
     # --- Category keywords ---
     CATEGORY_TAGS = {
@@ -353,6 +364,9 @@ class MarketIntelligenceEngine:
         self.clob_api_url = "https://clob.polymarket.com"
         self._limiter = AsyncLimiter(60, 60)
         self._session: Optional[aiohttp.ClientSession] = None
+        # Trending results: (category, timeframe, limit) → (markets, fetched_at)
+        self._trending_mem: Dict[Tuple[Category, TimeFrame, int], Tuple[List[MarketStats], float]] = {}
+        self._trending_inflight: Dict[Tuple[Category, TimeFrame, int], asyncio.Future] = {}
 
     async def init(self) -> None:
         if self._session is None:
@@ -510,25 +524,41 @@ class MarketIntelligenceEngine:
 
         logger.info(f"Parsed {len(markets)} valid markets for slug={slug}")
 
-        # Enrich with whale data
+        # Enrich with whale data — concurrently, one trades request per market,
+        # at most ENRICH_CONCURRENCY in flight so big events don't burst the API
+        sem = asyncio.Semaphore(self.ENRICH_CONCURRENCY)
+
+        async def _bounded(m: MarketStats) -> MarketStats:
+            async with sem:
+                return await self._enrich_and_score(m)
+
+        results = await asyncio.gather(
+            *(_bounded(m) for m in markets),
+            return_exceptions=True,
+        )
         enriched = []
-        for m in markets:
-            try:
-                m = await self._enrich_market_data(m)
-                self._calculate_signal(m)
-                enriched.append(m)
-            except Exception as e:
-                logger.error(f"Failed to enrich {m.slug}: {e}")
+        for m, res in zip(markets, results):
+            if isinstance(res, BaseException):
+                logger.error(f"Failed to enrich {m.slug}: {res}")
                 enriched.append(m)
+            else:
+                enriched.append(res)
 
         enriched.sort(key=lambda m: m.volume_24h, reverse=True)
         return enriched
 
+    async def _enrich_and_score(self, m: MarketStats) -> MarketStats:
+        """Enrich one market with trade data and compute its signal."""
+        m = await self._enrich_market_data(m)
+        self._calculate_signal(m)
+        return m
+
     async def fetch_trending_markets(
         self,
         category: Category = Category.ALL,
         timeframe: TimeFrame = TimeFrame.WEEK,  # Parameter kept for compatibility but ignored in simplified logic
         limit: int = 100,  # Increased limit as requested
+        force_refresh: bool = False,
     ) -> List[MarketStats]:
         """
         Fetch trending markets (Simplified High-Volume Logic).
@@ -540,7 +570,39 @@ class MarketIntelligenceEngine:
            - Prices < 5¢ or > 95¢ (implied odds 5-95%)
         3. Sort by Volume 24h
         4. Return top `limit` items
+
+        Results are cached in memory for TRENDING_CACHE_TTL seconds.
+        Concurrent callers for the same key share one in-flight fetch.
+        force_refresh=True bypasses the cache. The returned list is
+        shared — don't mutate it.
         """
+        key = (category, timeframe, limit)
+        if not force_refresh:
+            entry = self._trending_mem.get(key)
+            if entry and _time.time() - entry[1] < self.TRENDING_CACHE_TTL:
+                return entry[0]
+            pending = self._trending_inflight.get(key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+
+        task = asyncio.ensure_future(self._load_trending(key))
+        self._trending_inflight[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if self._trending_inflight.get(key) is task:
+                del self._trending_inflight[key]
+
+    async def _load_trending(self, key: Tuple[Category, TimeFrame, int]) -> List[MarketStats]:
+        """Network fetch; fills the in-memory cache on success."""
+        category, timeframe, limit = key
+        markets = await self._fetch_trending_markets(category, limit)
+        if markets:
+            self._trending_mem[key] = (markets, _time.time())
+        return markets
+
+    async def _fetch_trending_markets(self, category: Category, limit: int) -> List[MarketStats]:
+        """Uncached trending fetch — see fetch_trending_markets."""
         params = {
             "active": "true", 
             "closed": "false",
@@ -557,12 +619,17 @@ class MarketIntelligenceEngine:
             return []
 
         markets = []
+        seen = set()  # condition_ids already kept — dedupe while parsing
         for item in data:
             try:
                 m = self._parse_market(item)
                 if not m:
                     continue
 
+                cid = m.condition_id
+                if cid in seen:
+                    continue
+
                 # --- 1. Category Filter ---
                 if category != Category.ALL:
                     if not self._matches_category(m, category):
@@ -579,15 +646,14 @@ class MarketIntelligenceEngine:
                 if m.liquidity < 1000 or m.volume_24h < 100:
                     continue
 
+                if cid:
+                    seen.add(cid)
                 markets.append(m)
             except Exception:
                 continue
 
-        # Sort by 24h volume descending
-        markets.sort(key=lambda m: m.volume_24h, reverse=True)
-        
-        # Return top N
-        return markets[:limit]
+        # Top N by 24h volume — partial selection, no full sort needed
+        return heapq.nlargest(limit, markets, key=lambda m: m.volume_24h)
 
     # =================================================================
     # PARSING
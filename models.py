@@ -3,6 +3,7 @@ SQLAlchemy 2.0 async models for the Polymarket Whale Tracker.
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List
 from sqlalchemy import (
     String, BigInteger, DateTime, ForeignKey, Index, UniqueConstraint, func,
@@ -12,6 +13,8 @@ from sqlalchemy.orm import (
     DeclarativeBase, Mapped, mapped_column, relationship
 )
 
+from config import get_profile_link
+
 
 class Base(DeclarativeBase):
     """Base class for all models."""
@@ -45,11 +48,15 @@ class User(Base):
     )
     
     # Relationships
+    # Not loaded implicitly: every get_or_create would otherwise pay a second
+    # SELECT for the wallet list. Load via WalletRepository.get_user_wallets;
+    # deletes rely on the FK's ON DELETE CASCADE (passive_deletes).
     wallets: Mapped[List["TrackedWallet"]] = relationship(
         "TrackedWallet",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="raise"
     )
     
     def __repr__(self) -> str:
@@ -108,13 +115,20 @@ class TrackedWallet(Base):
     def __repr__(self) -> str:
         return f"<TrackedWallet(address={self.wallet_address}, nickname={self.nickname})>"
     
-    @property
+    # wallet_address never changes after insert, so the display strings used
+    # by the wallet list keyboard are computed once per loaded instance.
+    @cached_property
     def short_address(self) -> str:
         """Return shortened wallet address (0x1234...abcd)."""
         if len(self.wallet_address) > 10:
-            return f"{self.wallet_address[:6]}...{self.wallet_address[-4:]}"
+            return self.wallet_address[:6] + "..." + self.wallet_address[-4:]
         return self.wallet_address
 
+    @cached_property
+    def profile_url(self) -> str:
+        """Polymarket profile link with referral code."""
+        return get_profile_link(self.wallet_address)
+
 
 class OpenPosition(Base):
     """
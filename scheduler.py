@@ -4,7 +4,6 @@ APScheduler-based trade polling and notification system.
 
 import asyncio
 import time
-import html
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
@@ -21,6 +20,7 @@ from config import get_settings, get_profile_link
 from polymarket_api import api_client, Trade
 from models import User, TrackedWallet, OpenPosition
 from i18n import get_text, get_side_text
+from services.format_service import escape_html
 
 
 @dataclass
@@ -635,7 +635,7 @@ class TradeNotificationService:
         return get_text(
             "trade_closed",
             lang,
-            wallet_name=html.escape(wallet_name),
+            wallet_name=escape_html(wallet_name),
             market_title=trade.title,
             side=side_text,
             outcome=trade.outcome,
@@ -665,7 +665,7 @@ class TradeNotificationService:
         return get_text(
             "trade_closed_no_entry",
             lang,
-            wallet_name=html.escape(wallet_name),
+            wallet_name=escape_html(wallet_name),
             market_title=trade.title,
             side=side_text,
             outcome=trade.outcome,
@@ -711,7 +711,7 @@ class TradeNotificationService:
             header_key, lang,
             count=trade_count,
             profile_link=profile_link,
-            wallet_name=html.escape(wallet_name),
+            wallet_name=escape_html(wallet_name),
             time=latest_time,
             total_usdc=total_usdc
         )
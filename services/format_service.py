@@ -7,8 +7,8 @@ Extracted from handlers_intelligence.py to:
 3. Allow reuse in notifications, watchlist, etc.
 """
 
-import html
 import time
+from functools import lru_cache
 from typing import Any, List
 from loguru import logger
 
@@ -18,37 +18,79 @@ from market_intelligence import (
 )
 
 
+# Horizontal rule used by the detail cards (built once, not per render)
+_HR28 = "─" * 28 + "\n"
+
+# Same mapping as html.escape(quote=True), applied in a single translate pass
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def escape_html(text: str) -> str:
+    """Escape text for Telegram HTML parse mode."""
+    return text.translate(_HTML_ESCAPE)
+
+
+# (threshold, divisor, format) — checked top-down, first match wins
+_VOL_TIERS = (
+    (1_000_000, 1_000_000, "${:.1f}M"),
+    (1_000, 1_000, "${:.0f}K"),
+)
+
+
+@lru_cache(maxsize=4096)
 def format_volume(volume: float) -> str:
-    if volume >= 1_000_000:
-        return f"${volume/1_000_000:.1f}M"
-    elif volume >= 1_000:
-        return f"${volume/1_000:.0f}K"
+    for threshold, divisor, fmt in _VOL_TIERS:
+        if volume >= threshold:
+            return fmt.format(volume / divisor)
     return f"${volume:.0f}"
 
 
+@lru_cache(maxsize=4096)
 def format_price(price: float) -> str:
     return f"{int(price * 100)}¢"
 
 
+@lru_cache(maxsize=1024)
+def format_days_to_close(days: int, lang: str) -> str:
+    """Short "closes in" label for list cards (today / tomorrow / N days)."""
+    if days == 0:
+        return get_text("card.today", lang)
+    if days == 1:
+        return get_text("card.tomorrow", lang)
+    return get_text("card.days", lang, days=days)
+
+
+# Keyed by enum .value: plain str hashing, no Python-level Enum.__hash__ call
+_SIGNAL_EMOJI = {
+    SignalStrength.STRONG_BUY.value: "🟢🟢",
+    SignalStrength.BUY.value: "🟢",
+    SignalStrength.MODERATE.value: "🟡",
+    SignalStrength.WEAK.value: "🟠",
+    SignalStrength.AVOID.value: "🔴",
+}
+
+
 def format_signal_emoji(strength: SignalStrength) -> str:
-    return {
-        SignalStrength.STRONG_BUY: "🟢🟢",
-        SignalStrength.BUY: "🟢",
-        SignalStrength.MODERATE: "🟡",
-        SignalStrength.WEAK: "🟠",
-        SignalStrength.AVOID: "🔴",
-    }.get(strength, "⚪")
+    return _SIGNAL_EMOJI.get(strength.value, "⚪")
+
+
+_QUALITY_KEYS = {
+    MarketQuality.HIGH_CONVICTION.value: "quality.high_conviction",
+    MarketQuality.MODERATE_SIGNAL.value: "quality.moderate_signal",
+    MarketQuality.NOISY.value: "quality.noisy",
+    MarketQuality.LOW_LIQUIDITY.value: "quality.low_liquidity",
+    MarketQuality.AVOID.value: "quality.avoid",
+}
 
 
 def format_quality_label(quality: MarketQuality, lang: str) -> str:
-    key_map = {
-        MarketQuality.HIGH_CONVICTION: "quality.high_conviction",
-        MarketQuality.MODERATE_SIGNAL: "quality.moderate_signal",
-        MarketQuality.NOISY: "quality.noisy",
-        MarketQuality.LOW_LIQUIDITY: "quality.low_liquidity",
-        MarketQuality.AVOID: "quality.avoid",
-    }
-    return get_text(key_map.get(quality, "quality.avoid"), lang)
+    return get_text(_QUALITY_KEYS.get(quality.value, "quality.avoid"), lang)
 
 
 def format_whale_block(wa: Any, lang: str) -> str:
@@ -258,124 +300,170 @@ def format_comparison(yes_stats: Any, no_stats: Any, lang: str) -> str:
         return ""
 
 
+# Compact list card; filled via format_map in _format_market_card_cached
+_CARD_TMPL = (
+    "<b>{idx}. {title}</b>\n"
+    "   💰 YES {yes} · NO {no}  📊 {vol}\n"
+    "   🐋 {whale}  {time}\n"
+    "   {sig} <b>{score}/100 → {side}</b>\n"
+)
+
+
 def format_market_card(market: MarketStats, index: int, lang: str) -> str:
     """Compact card for list view."""
-    sig = format_signal_emoji(market.signal_strength)
     wa = market.whale_analysis
 
     whale_str = "—"
     if wa and wa.is_significant:
         whale_str = f"{wa.dominance_side} {wa.dominance_pct:.0f}%"
 
-    if market.days_to_close == 0:
-        time_str = get_text("card.today", lang)
-    elif market.days_to_close == 1:
-        time_str = get_text("card.tomorrow", lang)
-    else:
-        time_str = get_text("card.days", lang, days=market.days_to_close)
+    return _format_market_card_cached(
+        index,
+        market.question,
+        market.yes_price,
+        market.no_price,
+        market.volume_24h,
+        whale_str,
+        market.days_to_close,
+        market.signal_strength.value,
+        market.signal_score,
+        market.recommended_side,
+        lang,
+    )
 
-    q = html.escape(market.question[:55])
-    ellipsis = "..." if len(market.question) > 55 else ""
 
-    return (
-        f"<b>{index}. {q}{ellipsis}</b>\n"
-        f"   💰 YES {format_price(market.yes_price)} · NO {format_price(market.no_price)}"
-        f"  📊 {format_volume(market.volume_24h)}\n"
-        f"   🐋 {whale_str}  {time_str}\n"
-        f"   {sig} <b>{market.signal_score}/100 → {market.recommended_side}</b>\n"
-    )
+@lru_cache(maxsize=4096)
+def _format_market_card_cached(
+    index: int,
+    question: str,
+    yes_price: float,
+    no_price: float,
+    volume_24h: float,
+    whale_str: str,
+    days_to_close: int,
+    signal_strength: str,
+    signal_score: int,
+    recommended_side: str,
+    lang: str,
+) -> str:
+    """Pure card renderer — identical inputs (redraws, page flips) hit the cache."""
+    sig = _SIGNAL_EMOJI.get(signal_strength, "⚪")
+
+    time_str = format_days_to_close(days_to_close, lang)
+    # Slice only when needed; escape the (possibly truncated) buffer once
+    if len(question) > 55:
+        title = escape_html(question[:55]) + "…"
+    else:
+        title = escape_html(question)
+
+    return _CARD_TMPL.format_map({
+        "idx": index,
+        "title": title,
+        "yes": format_price(yes_price),
+        "no": format_price(no_price),
+        "vol": format_volume(volume_24h),
+        "whale": whale_str,
+        "time": time_str,
+        "sig": sig,
+        "score": signal_score,
+        "side": recommended_side,
+    })
+
+
+# Score breakdown rows: (breakdown key, i18n key, max points)
+_SCORE_KEYS = (
+    ("tilt", "detail.score_tilt", 40),
+    ("volume", "detail.score_volume", 25),
+    ("sm_ratio", "detail.score_sm_ratio", 15),
+    ("liquidity", "detail.score_liquidity", 10),
+    ("recency", "detail.score_recency", 10),
+)
 
 
 def format_market_detail(market: MarketStats, rec: BetRecommendation, lang: str) -> str:
     """Full market detail card — fully i18n."""
     sig = format_signal_emoji(market.signal_strength)
-    q = html.escape(market.question)
+    q = escape_html(market.question)
 
-    text = f"<b>{q}</b>\n{'─' * 28}\n\n"
+    parts: List[str] = []
+    _a = parts.append
+    _a(f"<b>{q}</b>\n{_HR28}\n")
 
     # Prices
-    text += f"💰 YES: <b>{format_price(market.yes_price)}</b>  ·  NO: <b>{format_price(market.no_price)}</b>\n"
-    text += get_text("detail.vol_24h", lang, vol=format_volume(market.volume_24h), total=format_volume(market.volume_total)) + "\n"
+    _a(f"💰 YES: <b>{format_price(market.yes_price)}</b>  ·  NO: <b>{format_price(market.no_price)}</b>\n")
+    _a(get_text("detail.vol_24h", lang, vol=format_volume(market.volume_24h), total=format_volume(market.volume_total)) + "\n")
 
     if market.liquidity > 0:
-        text += get_text("detail.liquidity", lang, vol=format_volume(market.liquidity)) + "\n"
+        _a(get_text("detail.liquidity", lang, vol=format_volume(market.liquidity)) + "\n")
 
     # Time
     if market.days_to_close < 0:
-        text += "🔒 <b>" + get_text("event_finished", lang) + "</b>\n"
+        _a("🔒 <b>" + get_text("event_finished", lang) + "</b>\n")
     elif market.days_to_close == 0:
-        text += get_text("detail.closes_today", lang) + "\n"
+        _a(get_text("detail.closes_today", lang) + "\n")
     elif market.days_to_close == 1:
-        text += get_text("detail.closes_tomorrow", lang) + "\n"
+        _a(get_text("detail.closes_tomorrow", lang) + "\n")
     else:
-        text += get_text("detail.closes_date", lang, date=market.end_date.strftime("%d.%m.%Y"), days=market.days_to_close) + "\n"
+        _a(get_text("detail.closes_date", lang, date=market.end_date.strftime("%d.%m.%Y"), days=market.days_to_close) + "\n")
 
-    text += "\n"
+    _a("\n")
 
     # Whale analysis
     wa_block = format_whale_block(market.whale_analysis, lang)
     if wa_block:
-        text += wa_block
+        _a(wa_block)
     else:
-        text += get_text("detail.smart_money", lang) + "\n"
-        text += get_text("detail.no_whale_activity", lang) + "\n"
+        _a(get_text("detail.smart_money", lang) + "\n")
+        _a(get_text("detail.no_whale_activity", lang) + "\n")
 
-    text += "\n"
+    _a("\n")
 
     # Quality
-    text += f"🏷 {format_quality_label(market.market_quality, lang)}\n"
+    _a(f"🏷 {format_quality_label(market.market_quality, lang)}\n")
 
     # Score breakdown
     bd = market.score_breakdown
     if bd:
-        text += f"\n{get_text('detail.score_breakdown', lang)}\n"
-        score_keys = [
-            ("tilt", "detail.score_tilt", 40),
-            ("volume", "detail.score_volume", 25),
-            ("sm_ratio", "detail.score_sm_ratio", 15),
-            ("liquidity", "detail.score_liquidity", 10),
-            ("recency", "detail.score_recency", 10),
-        ]
-        for key, text_key, mx in score_keys:
-            text += get_text(text_key, lang, v=bd.get(key, 0), max=mx) + "\n"
-
-    text += f"\n{'─' * 28}\n"
-    text += get_text("detail.signal", lang, emoji=sig, score=market.signal_score) + "\n\n"
+        _a(f"\n{get_text('detail.score_breakdown', lang)}\n")
+        for key, text_key, mx in _SCORE_KEYS:
+            _a(get_text(text_key, lang, v=bd.get(key, 0), max=mx) + "\n")
+
+    _a(f"\n{_HR28}")
+    _a(get_text("detail.signal", lang, emoji=sig, score=market.signal_score) + "\n\n")
 
     # Recommendation
     if rec.should_bet:
-        text += get_text("detail.rec_bet", lang, side=rec.side, price=format_price(rec.entry_price)) + "\n"
+        _a(get_text("detail.rec_bet", lang, side=rec.side, price=format_price(rec.entry_price)) + "\n")
         if rec.entry_price > 0:
             tgt_pct = ((rec.target_price / rec.entry_price) - 1) * 100
             stop_pct = (1 - (rec.stop_loss_price / rec.entry_price)) * 100
         else:
             tgt_pct = stop_pct = 0
-        text += get_text("detail.rec_target", lang,
-                         target=format_price(rec.target_price), pct=f"{tgt_pct:.0f}",
-                         stop=format_price(rec.stop_loss_price), spct=f"{stop_pct:.0f}") + "\n"
-        text += get_text("detail.rec_rr", lang, rr=f"{rec.risk_reward_ratio:.1f}") + "\n"
+        _a(get_text("detail.rec_target", lang,
+                    target=format_price(rec.target_price), pct=f"{tgt_pct:.0f}",
+                    stop=format_price(rec.stop_loss_price), spct=f"{stop_pct:.0f}") + "\n")
+        _a(get_text("detail.rec_rr", lang, rr=f"{rec.risk_reward_ratio:.1f}") + "\n")
     else:
-        text += get_text("detail.rec_no_bet", lang, side=rec.side) + "\n"
+        _a(get_text("detail.rec_no_bet", lang, side=rec.side) + "\n")
 
     # Reasons & warnings
     if rec.reasons:
-        text += "\n"
+        _a("\n")
         for r in rec.reasons:
-            text += f"  {r}\n"
+            _a(f"  {r}\n")
     if rec.warnings:
-        text += "\n"
+        _a("\n")
         for w in rec.warnings:
-            text += f"  {w}\n"
+            _a(f"  {w}\n")
 
-    return text
+    return "".join(parts)
 
 
 def format_market_links_footer(markets: List[MarketStats], start_idx: int, lang: str) -> str:
-    text = "\n🔗 <b>Links:</b>\n"
-    for i, m in enumerate(markets[:5]):
-        idx = start_idx + i
-        text += f"  {idx}. <a href='{m.market_url}'>{html.escape(m.question[:40])}</a>\n"
-    return text
+    return "\n🔗 <b>Links:</b>\n" + "".join(
+        f"  {idx}. <a href='{m.market_url}'>{escape_html(m.question[:40])}</a>\n"
+        for idx, m in enumerate(markets[:5], start_idx)
+    )
 
 
 def format_unified_analysis(market: MarketStats, deep_result: Any, lang: str) -> str:
@@ -435,11 +523,11 @@ def _format_quant_analysis_v3(market: MarketStats, deep: Any, lang: str) -> str:
         # ---------------------------
         text = ""
         # Counter-Strike: Sinners vs fnatic (BO3)
-        text += f"<b>{html.escape(market.question)}</b>\n\n"
+        text += f"<b>{escape_html(market.question)}</b>\n\n"
         
         # 💰 YES 59¢ · NO 40¢ · Vol 24h: $113K
         text += f"💰 YES {format_price(market.yes_price)} · NO {format_price(market.no_price)} · Vol 24h: {format_volume(market.volume_24h)}\n"
-        text += "────────────────────────────\n"
+        text += _HR28
 
 
 
@@ -538,7 +626,7 @@ def format_new_trade(
         key, lang,
         wallet_name=wallet_name,
         profile_link=profile_link,
-        market_title=html.escape(market_title),
+        market_title=escape_html(market_title),
         side=f"{side_emoji} {side_text}", # "🟢 ПОКУПКА"
         outcome=outcome,
         size=size,
@@ -0,0 +1,57 @@
+"""
+Telegram message helpers — resilient edits for callback handlers.
+
+BEFORE (repeated in handlers):
+    try:
+        await callback.message.edit_text(text, parse_mode=ParseMode.HTML)
+    except Exception:
+        pass
+
+AFTER:
+    await safe_edit(callback.message, text, parse_mode=ParseMode.HTML)
+
+Errors are classified instead of swallowed blindly:
+- TelegramRetryAfter   → wait the flood-control delay and retry
+- "message is not modified" → treated as success (same content)
+- TelegramNetworkError → retry with backoff
+- anything else        → logged, edit abandoned (never a duplicate message)
+"""
+
+import asyncio
+from typing import Any
+
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramBadRequest,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+)
+from aiogram.types import Message
+from loguru import logger
+
+
+async def safe_edit(message: Message, text: str, retries: int = 3, **kwargs: Any) -> bool:
+    """Edit a message's text, retrying transient Telegram failures.
+
+    Returns True if the message now shows `text`, False if the edit was
+    given up on. Never falls back to sending a new message.
+    """
+    for attempt in range(retries):
+        try:
+            await message.edit_text(text, **kwargs)
+            return True
+        except TelegramRetryAfter as e:
+            logger.warning(f"edit_text flood control, retrying in {e.retry_after}s")
+            await asyncio.sleep(e.retry_after)
+        except TelegramBadRequest as e:
+            if "message is not modified" in str(e).lower():
+                return True
+            logger.debug(f"edit_text rejected: {e}")
+            return False
+        except TelegramNetworkError as e:
+            logger.warning(f"edit_text network error (attempt {attempt + 1}/{retries}): {e}")
+            await asyncio.sleep(0.5 * 2 ** attempt)
+        except TelegramAPIError as e:
+            logger.warning(f"edit_text failed: {e}")
+            return False
+    return False
\ No newline at end of file
@@ -15,27 +15,115 @@ AFTER:
     user, lang = await resolve_user(callback.from_user)
 """
 
-from typing import Tuple, Optional
-from aiogram.types import User as TgUser
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Set, Tuple, Optional
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, User as TgUser
+from loguru import logger
 
 from database import db
 from repository import UserRepository
 from models import User
 
 
+# telegram_id → (User, lang, resolved_at). Callback-heavy flows (page flips,
+# back navigation) resolve the same user many times a minute; serve those
+# from memory and only hit the DB on a miss.
+_USER_CACHE: Dict[int, Tuple[User, str, float]] = {}
+_USER_CACHE_TTL = 300  # seconds
+_USER_CACHE_MAX_SIZE = 10_000  # hard cap; oldest entries are evicted first
+
+
+def _cache_user(telegram_id: int, user: User, lang: str) -> None:
+    """Store a resolved user, keeping the cache bounded.
+
+    Re-inserting moves the entry to the back, so insertion order is
+    resolve order: expired entries are swept on overflow, then the
+    oldest are evicted from the front.
+    """
+    now = time.time()
+    _USER_CACHE.pop(telegram_id, None)
+    _USER_CACHE[telegram_id] = (user, lang, now)
+    if len(_USER_CACHE) > _USER_CACHE_MAX_SIZE:
+        expired = [k for k, entry in _USER_CACHE.items() if now - entry[2] >= _USER_CACHE_TTL]
+        for k in expired:
+            del _USER_CACHE[k]
+        while len(_USER_CACHE) > _USER_CACHE_MAX_SIZE:
+            del _USER_CACHE[next(iter(_USER_CACHE))]
+
+
+# Background profile refreshes: strong refs so tasks aren't GC'd mid-flight,
+# and one pending update per user at most.
+_PROFILE_TASKS: Set[asyncio.Task] = set()
+_PROFILE_PENDING: Set[int] = set()
+
+
+def _profile_changed(user: User, tg_user: TgUser) -> bool:
+    return bool(
+        (tg_user.username and user.username != tg_user.username)
+        or (tg_user.first_name and user.first_name != tg_user.first_name)
+    )
+
+
+def _schedule_profile_update(tg_user: TgUser) -> None:
+    """Persist username/first_name changes off the request path."""
+    if tg_user.id in _PROFILE_PENDING:
+        return
+    _PROFILE_PENDING.add(tg_user.id)
+    task = asyncio.create_task(_update_profile(tg_user))
+    _PROFILE_TASKS.add(task)
+    task.add_done_callback(_PROFILE_TASKS.discard)
+
+
+async def _update_profile(tg_user: TgUser) -> None:
+    try:
+        async with db.session() as session:
+            repo = UserRepository(session)
+            # get_or_create refreshes changed profile fields on an existing user
+            await repo.get_or_create(
+                telegram_id=tg_user.id,
+                username=tg_user.username,
+                first_name=tg_user.first_name,
+            )
+        invalidate_user(tg_user.id)
+    except Exception as e:
+        logger.warning(f"Profile update failed for {tg_user.id}: {e}")
+    finally:
+        _PROFILE_PENDING.discard(tg_user.id)
+
+
+def invalidate_user(telegram_id: int) -> None:
+    """Drop a cached user — call after changing stored user fields."""
+    _USER_CACHE.pop(telegram_id, None)
+
+
 async def resolve_user(tg_user: TgUser) -> Tuple[User, str]:
     """Resolve Telegram user to DB user + language code.
     
     Creates user if not exists. Always returns (User, lang_code).
+    Results are cached per telegram_id for _USER_CACHE_TTL.
     """
+    entry = _USER_CACHE.get(tg_user.id)
+    if entry and time.time() - entry[2] < _USER_CACHE_TTL:
+        return entry[0], entry[1]
+
+    # Read-through: a plain SELECT for existing users; only a miss writes
     async with db.session() as session:
         repo = UserRepository(session)
-        user = await repo.get_or_create(
-            telegram_id=tg_user.id,
-            username=tg_user.username,
-            first_name=tg_user.first_name,
-        )
-        return user, user.language
+        user = await repo.get_by_telegram_id(tg_user.id)
+        if user is None:
+            user = await repo.get_or_create(
+                telegram_id=tg_user.id,
+                username=tg_user.username,
+                first_name=tg_user.first_name,
+            )
+        elif _profile_changed(user, tg_user):
+            _schedule_profile_update(tg_user)
+
+    # Cache only after the session has committed
+    _cache_user(tg_user.id, user, user.language)
+    return user, user.language
 
 
 async def get_user_lang(tg_user: TgUser) -> str:
@@ -49,3 +137,24 @@ async def update_language(telegram_id: int, lang_code: str) -> None:
     async with db.session() as session:
         repo = UserRepository(session)
         await repo.update_language(telegram_id, lang_code)
+    invalidate_user(telegram_id)
+
+
+class UserResolverMiddleware(BaseMiddleware):
+    """Resolve the sender once per update and inject `user` and `lang`.
+
+    Handlers declare `user` / `lang` parameters instead of calling
+    resolve_user themselves. Backed by the same TTL cache as resolve_user.
+    Does not touch FSM state.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        tg_user = data.get("event_from_user")
+        if tg_user is not None:
+            data["user"], data["lang"] = await resolve_user(tg_user)
+        return await handler(event, data)
\ No newline at end of file
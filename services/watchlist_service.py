@@ -11,9 +11,11 @@ Storage: simple DB table (user_id, market_slug, event_slug, question, added_at)
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import String, BigInteger, DateTime, ForeignKey, func, select, delete
+from sqlalchemy import (
+    String, BigInteger, DateTime, ForeignKey, func, select, delete, insert, exists, literal,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 from loguru import logger
 
@@ -46,25 +48,34 @@ class WatchlistService:
 
     @staticmethod
     async def add(session, user_id: int, market_slug: str, event_slug: str, question: str, condition_id: str = None) -> bool:
-        """Add market to watchlist. Returns True if added, False if already exists."""
-        existing = await session.execute(
-            select(WatchlistItem).where(
-                WatchlistItem.user_id == user_id,
-                WatchlistItem.market_slug == market_slug,
+        """Add market to watchlist. Returns True if added, False if already exists.
+
+        One round-trip: INSERT ... SELECT ... WHERE NOT EXISTS ... RETURNING id.
+        The table has no unique (user_id, market_slug) constraint to hang an
+        ON CONFLICT on, so the existence check is folded into the insert.
+        """
+        already = exists().where(
+            WatchlistItem.user_id == user_id,
+            WatchlistItem.market_slug == market_slug,
+        )
+        row = select(
+            literal(user_id, BigInteger),
+            literal(market_slug, String),
+            literal(event_slug, String),
+            literal(question, String),
+            literal(condition_id, String),
+        ).where(~already)
+        result = await session.execute(
+            insert(WatchlistItem)
+            .from_select(
+                ["user_id", "market_slug", "event_slug", "question", "condition_id"],
+                row,
             )
+            .returning(WatchlistItem.id)
         )
-        if existing.scalar_one_or_none():
+        if result.scalar_one_or_none() is None:
             return False
 
-        item = WatchlistItem(
-            user_id=user_id,
-            market_slug=market_slug,
-            event_slug=event_slug,
-            question=question,
-            condition_id=condition_id,
-        )
-        session.add(item)
-        await session.flush()
         logger.info(f"Watchlist: user {user_id} added {market_slug}")
         return True
 
@@ -92,6 +103,38 @@ class WatchlistService:
         )
         return list(result.scalars().all())
 
+    @staticmethod
+    async def count(session, user_id: int) -> int:
+        """Number of items in a user's watchlist (served by the user_id index)."""
+        result = await session.execute(
+            select(func.count()).select_from(WatchlistItem)
+            .where(WatchlistItem.user_id == user_id)
+        )
+        return result.scalar_one()
+
+    @staticmethod
+    async def list_page(
+        session, user_id: int, page: int = 0, limit: int = 20,
+    ) -> Tuple[List[WatchlistItem], int, int]:
+        """One page of watchlist items, newest first.
+
+        Returns (items, total, page). `page` is clamped to the last
+        non-empty page, so a stale "next" button (e.g. after removals)
+        still lands on real items.
+        """
+        total = await WatchlistService.count(session, user_id)
+        if not total:
+            return [], 0, 0
+        page = max(0, min(page, (total - 1) // limit))
+        result = await session.execute(
+            select(WatchlistItem)
+            .where(WatchlistItem.user_id == user_id)
+            .order_by(WatchlistItem.added_at.desc(), WatchlistItem.id.desc())
+            .offset(page * limit)
+            .limit(limit)
+        )
+        return list(result.scalars().all()), total, page
+
     @staticmethod
     async def is_in_watchlist(session, user_id: int, market_slug: str) -> bool:
         """Check if market is in user's watchlist."""
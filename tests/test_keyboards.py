@@ -0,0 +1,77 @@
+"""
+keyboards.py builds most buttons with model_construct (no pydantic
+validation), so these checks stand in for it: every callback_data fits
+Telegram's 64-byte limit and every URL button carries a valid https URL.
+"""
+
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+import pytest
+
+pytest.importorskip("aiogram")
+
+import keyboards as kb  # noqa: E402
+from config import get_profile_link  # noqa: E402
+from i18n import SUPPORTED_LANGUAGES  # noqa: E402
+
+MAX_CALLBACK_BYTES = 64
+BIG_ID = 2**63 - 1  # BIGINT max — the longest id a callback can carry
+ADDRESS = "0x" + "ab" * 20
+# Non-ASCII profile name: 2 bytes per char, so a char-count cap isn't enough
+LONG_NAME = "Дуже довге ім'я гаманця " * 5
+
+
+def _wallet(paused: bool) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=BIG_ID,
+        nickname=LONG_NAME,
+        is_paused=paused,
+        short_address=ADDRESS[:6] + "..." + ADDRESS[-4:],
+        profile_url=get_profile_link(ADDRESS),
+    )
+
+
+def _all_keyboards(lang: str):
+    yield kb.get_language_keyboard()
+    yield kb.get_main_menu_keyboard(lang)
+    yield kb.get_cancel_keyboard(lang)
+    yield kb.get_back_to_menu_keyboard(lang)
+    yield kb.get_watchlist_keyboard(lang, 0, False)
+    yield kb.get_watchlist_keyboard(lang, BIG_ID, True)
+    yield kb.get_nickname_keyboard(lang, ADDRESS)
+    yield kb.get_nickname_keyboard(lang, ADDRESS, LONG_NAME)
+    yield kb.get_wallet_list_keyboard(lang, [_wallet(False), _wallet(True)])
+    yield kb.get_wallet_details_keyboard(lang, BIG_ID)
+    yield kb.get_wallet_details_keyboard(lang, BIG_ID, ADDRESS)
+    yield kb.get_wallet_settings_keyboard(lang, BIG_ID, False)
+    yield kb.get_wallet_settings_keyboard(lang, BIG_ID, True)
+    yield kb.get_min_amount_keyboard(lang, BIG_ID)
+    yield kb.get_confirm_remove_keyboard(lang, BIG_ID)
+    yield kb.get_wallet_back_keyboard(lang, BIG_ID)
+    yield kb.get_settings_keyboard(lang)
+    yield kb.get_settings_language_keyboard(lang)
+    yield kb.get_stats_range_keyboard(lang, BIG_ID)
+    yield kb.get_back_to_results_keyboard(lang)
+    yield kb.get_markets_selection_keyboard(lang, 5)
+
+
+@pytest.mark.parametrize("lang", sorted(SUPPORTED_LANGUAGES))
+def test_inline_buttons_are_valid(lang):
+    for markup in _all_keyboards(lang):
+        for row in markup.inline_keyboard:
+            for btn in row:
+                assert btn.text
+                assert (btn.callback_data is None) != (btn.url is None), btn
+                if btn.callback_data is not None:
+                    size = len(btn.callback_data.encode())
+                    assert size <= MAX_CALLBACK_BYTES, (btn.callback_data, size)
+                else:
+                    parts = urlsplit(btn.url)
+                    assert parts.scheme == "https" and parts.netloc, btn.url
+
+
+def test_fit_callback_keeps_utf8_valid():
+    data = kb._fit_callback("nickname:use:", LONG_NAME)
+    assert len(data.encode()) <= MAX_CALLBACK_BYTES
+    assert LONG_NAME.startswith(data[len("nickname:use:"):])
\ No newline at end of file